@@ -4,12 +4,209 @@ Enhanced RAD Synthesizer Field Analyzer
 Analyzes GraphQL-like queries to extract all field access patterns and data requirements
 """
 
+import os
 import re
+import sys
+import copy
 import json
+import mmap
 from collections import defaultdict, Counter
-from typing import Dict, List, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import argparse
 
+try:
+    import orjson
+except ImportError:  # optional speedup, the stdlib encoder is used without it
+    orjson = None
+
+# Static patterns, compiled once at import time
+_ENTITY_PICK_RE = re.compile(r'entityPick\s*\(\s*(?P<pick_var>\w+)\s*,\s*\[(?P<pick_fields>[\s\S]*?)\]\s*\)')
+_FIELD_RE = re.compile(r'[\'"`]([^\'"`]+)[\'"`]')
+_QUERY_RE = re.compile(r'profile\.request\.query\.(?P<query_field>\w+)')
+# Anchored at a word start so a failed match is not retried inside the same word,
+# and the whitespace shared by every terminator is matched once
+_PROP_RE = re.compile(r'\b(?P<prop_var>\w+)\.(?P<prop_path>[a-zA-Z0-9_.?]+)\s*(?:[=!<>)]|\?\?|&&|\|\|)')
+_DESTRUCT_RE = re.compile(r'const\s*\{(?P<destruct_fields>[^}]+)\}\s*=\s*(?P<destruct_source>\w+)')
+_ENTITY_TYPE_RE = re.compile(r'entity\.type\s*===\s*[\'"`](\w+)[\'"`]')
+# Also covers the `entity.type` and `.type` forms, so one pass finds every type check
+_TYPE_RE = re.compile(r'type\s*===\s*[\'"`](\w+)[\'"`]')
+# Negated classes instead of stacked lazy quantifiers keep the search linear
+_JOIN_RE = re.compile(r'joinEntities[^\n(]*\([^\n]*?\)\s*=>\s*\((?P<condition>[^)]*)\)')
+_REL_RE = re.compile(r'(\w+)\.type\s*===\s*[\'"`](\w+)[\'"`]')
+_KEY_RE = re.compile(r'(\w+)\.(\w+)\s*===\s*(\w+)\.(\w+)')
+# Every kind of return is matched at its 'return' keyword; alternatives are
+# ordered by precedence so the first match at a position is the strongest
+_RETURN_RE = re.compile(
+    r'return(?:'
+    r'(?: \[\]|\[\];)(?P<empty_array>)'
+    r'|\s*\[\s*\{\s*type\s*:\s*["\']none["\'](?P<static_none>)'
+    r'|\s*\[\s*\{\s*\.\.\.(?P<spread_operator>)'
+    r'|(?=.*?ventureId)(?P<venture_based>)'
+    r')'
+)
+_RETURN_PRECEDENCE = ('empty_array', 'static_none', 'spread_operator', 'venture_based', 'dynamic')
+_RETURN_DYNAMIC = {'empty_array': False, 'static_none': False}
+
+# Keywords that place a field in a common data access pattern, in priority order
+_COMMON_PATTERNS = (
+    ('billing', ('billing', 'payment')),
+    ('entitlements', ('entitlement', 'current')),
+    ('features', ('feature', 'widget')),
+    ('social_media', ('facebook', 'instagram', 'social')),
+    ('commerce', ('product', 'commerce', 'ols')),
+    ('appointments', ('appointment', 'ola', 'service')),
+    ('authentication', ('account', 'shopper')),
+)
+_COMMON_PATTERN_PRIORITY = {
+    keyword: priority
+    for priority, (_, keywords) in enumerate(_COMMON_PATTERNS)
+    for keyword in keywords
+}
+# Zero-width lookahead so overlapping keyword occurrences are all reported
+_COMMON_PATTERN_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword in _COMMON_PATTERN_PRIORITY) + '))'
+)
+
+# RAD files at least this large are memory-mapped instead of read
+_MMAP_THRESHOLD = 1 << 20
+
+# Attributes recorded for each field access
+_FIELD_ACCESS_KEYS = ('field', 'normalized', 'entity_type', 'access_method')
+
+# Surrounding whitespace and quote characters removed from field paths
+_STRIP_CHARS = ' \t\n\r\f\v"\'`'
+
+# Common field path variations and the prefix they normalize to
+_NORMALIZATIONS = {
+    'entitlementData.current': 'entitlements.current',
+    'entitlementData.used': 'entitlements.used',
+    'entitlementData.transitionable': 'entitlements.transitionable',
+    'vnextAccount.billing': 'billing',
+    'vnextAccount.account': 'account',
+    'features.websiteType': 'websiteType',
+    'gem.subscriberCount': 'email.subscriberCount',
+    'gem.hasSent': 'email.hasSent',
+    'gem.lastFbPostDate': 'social.lastFacebookPost',
+    'gem.lastIgPostDate': 'social.lastInstagramPost',
+    'ols.products.count': 'commerce.productCount',
+    'ola.service.total': 'appointments.serviceCount',
+    'ola.account.status': 'appointments.status',
+}
+# Longest prefix first, so the alternation picks the most specific match
+_NORMALIZATION_RE = re.compile('(' + '|'.join(
+    re.escape(old) for old in sorted(_NORMALIZATIONS, key=len, reverse=True)
+) + ')')
+
+def _common_pattern_for(field: str) -> Optional[str]:
+    """Return the highest priority common pattern whose keywords occur in field"""
+    priorities = [_COMMON_PATTERN_PRIORITY[m.group(1)] for m in _COMMON_PATTERN_RE.finditer(field)]
+    return _COMMON_PATTERNS[min(priorities)][0] if priorities else None
+
+def _decode(data: bytes) -> str:
+    """Decode a slice of the RAD file as text mode reading would"""
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+def _find_heading(buf, start: int) -> int:
+    """Offset of the next line starting with '## ' at or after start, or -1"""
+    if start == 0 and buf[:3] == b'## ':
+        return 0
+    index = buf.find(b'\n## ', max(start - 1, 0))
+    return index + 1 if index != -1 else -1
+
+def _iter_synthesizers(buf) -> Iterator[Tuple[str, str]]:
+    """Yield (name, code) pairs from RAD markdown held in bytes or an mmap"""
+    heading = _find_heading(buf, 0)
+    while heading != -1:
+        name_end = buf.find(b'\n', heading)
+        if name_end == -1:
+            return
+        next_heading = _find_heading(buf, name_end + 1)
+        
+        # Find JavaScript code block
+        fence = buf.find(b'```javascript', name_end)
+        if fence == -1:
+            return
+        if next_heading != -1 and fence > next_heading:
+            heading = next_heading
+            continue
+            
+        code_start = fence + 13
+        code_end = buf.find(b'```', code_start)
+        if code_end == -1:
+            return
+        yield _decode(buf[heading + 3:name_end]).strip(), _decode(buf[code_start:code_end]).strip()
+        
+        # Headings inside the code block do not start a new section
+        line_end = buf.find(b'\n', code_end)
+        heading = _find_heading(buf, line_end + 1) if line_end != -1 else -1
+
+@lru_cache(maxsize=64)
+def _type_index(code: str) -> Tuple[Optional[Tuple[str, int]], Dict[str, str]]:
+    """Scan code once for entity type checks used by _infer_entity_type
+    
+    Returns the first `entity.type === 'X'` filter as (type, end offset) and
+    a map of variable name to the first type it is explicitly compared with.
+    """
+    match = _ENTITY_TYPE_RE.search(code)
+    first_filter = (sys.intern(match.group(1)), match.end()) if match else None
+    
+    type_checks = {}
+    for match in _REL_RE.finditer(code):
+        type_checks.setdefault(match.group(1), sys.intern(match.group(2)))
+        
+    return first_filter, type_checks
+
+@lru_cache(maxsize=4096)
+def _entity_type_for(code: str, entity_var: str) -> str:
+    """Infer entity type of a variable, memoized per (code, variable) pair"""
+    first_filter, type_checks = _type_index(code)
+    
+    # Look for filter patterns followed by a use of the variable
+    if first_filter and code.find(entity_var, first_filter[1]) != -1:
+        return first_filter[0]
+        
+    # Look for explicit type checks
+    if entity_var in type_checks:
+        return type_checks[entity_var]
+        
+    # Common variable name patterns
+    lowered = entity_var.lower()
+    if 'wsbv' in lowered:
+        return 'wsbvnext'
+    elif 'mktg' in lowered:
+        return 'mktgasst'
+    elif 'uce' in lowered:
+        return 'uce'
+        
+    return 'unknown'
+
+def _set_default(obj):
+    """JSON encoder fallback that serializes sets as lists"""
+    if isinstance(obj, set):
+        return list(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+def _dumps(obj) -> str:
+    """Serialize obj as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_set_default,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, indent=2, default=_set_default)
+
+def _access_dicts(accesses: Iterator[Tuple[str, str, str, str]]) -> List[Dict]:
+    """Expand field access tuples into dicts keyed by _FIELD_ACCESS_KEYS"""
+    return [dict(zip(_FIELD_ACCESS_KEYS, access)) for access in accesses]
+
+def _analyze_code(code: str) -> Tuple[Dict, Tuple]:
+    """Analyze one synthesizer body in a fresh analyzer, for worker processes"""
+    analyzer = RADFieldAnalyzer()
+    analysis = analyzer.analyze_synthesizer('', code)
+    return analysis, analyzer._shared_state()
+
 class RADFieldAnalyzer:
     def __init__(self):
         self.results = []
@@ -17,160 +214,121 @@ class RADFieldAnalyzer:
         self.entity_types = set()
         self.field_variations = defaultdict(set)  # Track different ways to access same data
         self.field_by_entity = defaultdict(set)  # Track which fields belong to which entity
+        self._analysis_cache = {}  # Analyses keyed by code digest, for duplicate synthesizers
         
     def normalize_field_path(self, field: str) -> str:
         """Normalize field paths to identify common data accessed differently"""
-        # Remove quotes and clean up
-        field = field.strip().strip('"\'`')
+        # Remove quotes and clean up; paths repeat across synthesizers, so
+        # interning them shares one object and speeds up later dict lookups
+        field = sys.intern(field.strip(_STRIP_CHARS))
         
         # Normalize common variations
-        normalizations = {
-            'entitlementData.current': 'entitlements.current',
-            'entitlementData.used': 'entitlements.used',
-            'entitlementData.transitionable': 'entitlements.transitionable',
-            'vnextAccount.billing': 'billing',
-            'vnextAccount.account': 'account',
-            'features.websiteType': 'websiteType',
-            'gem.subscriberCount': 'email.subscriberCount',
-            'gem.hasSent': 'email.hasSent',
-            'gem.lastFbPostDate': 'social.lastFacebookPost',
-            'gem.lastIgPostDate': 'social.lastInstagramPost',
-            'ols.products.count': 'commerce.productCount',
-            'ola.service.total': 'appointments.serviceCount',
-            'ola.account.status': 'appointments.status',
-        }
-        
-        for old, new in normalizations.items():
-            if field.startswith(old):
-                normalized = field.replace(old, new, 1)
-                self.field_variations[new].add(field)
-                return normalized
+        match = _NORMALIZATION_RE.match(field)
+        if match:
+            old = match.group(1)
+            new = _NORMALIZATIONS[old]
+            self.field_variations[new].add(field)
+            return sys.intern(new + field[len(old):])
                 
         return field
     
+    def scan_field_accesses(self, code: str) -> Iterator[Tuple[str, str, str, str]]:
+        """Extract entityPick, direct and destructured field accesses"""
+        # Each pattern gets its own scan: their matches can overlap, such as a
+        # property access inside an entityPick array, and one alternation would
+        # drop whichever match starts later
+        return chain(
+            self._entity_pick_accesses(code, _ENTITY_PICK_RE.finditer(code)),
+            self._query_accesses(_QUERY_RE.finditer(code)),
+            self._prop_accesses(code, _PROP_RE.finditer(code)),
+            self._destructuring_accesses(code, _DESTRUCT_RE.finditer(code)),
+        )
+    
     def extract_entity_pick_fields(self, code: str) -> List[Dict]:
         """Extract fields from entityPick calls with context"""
-        fields_with_context = []
-        
+        return _access_dicts(self._entity_pick_accesses(code, _ENTITY_PICK_RE.finditer(code)))
+    
+    def _entity_pick_accesses(self, code: str, matches) -> Iterator[Tuple[str, str, str, str]]:
+        """Yield (field, normalized, entity_type, access_method) for entityPick matches"""
         # Match entityPick with capturing the entity variable
-        pattern = r'entityPick\s*\(\s*(\w+)\s*,\s*\[([\s\S]*?)\]\s*\)'
-        
-        for match in re.finditer(pattern, code):
-            entity_var = match.group(1)
-            fields_str = match.group(2)
+        for match in matches:
+            entity_var = match['pick_var']
+            fields_str = match['pick_fields']
             
             # Extract individual fields
-            field_pattern = r'[\'"`]([^\'"`]+)[\'"`]'
-            fields = re.findall(field_pattern, fields_str)
+            fields = _FIELD_RE.findall(fields_str)
             
             # Determine entity type from context
             entity_type = self._infer_entity_type(code, entity_var)
+            normalized_fields = [self.normalize_field_path(field) for field in fields]
             
-            for field in fields:
-                normalized = self.normalize_field_path(field)
-                self.all_fields.add(normalized)
-                
-                if entity_type:
-                    self.field_by_entity[entity_type].add(normalized)
-                
-                fields_with_context.append({
-                    'field': field,
-                    'normalized': normalized,
-                    'entity_type': entity_type,
-                    'access_method': 'entityPick'
-                })
-                
-        return fields_with_context
+            # Record the whole pick at once rather than field by field
+            self.all_fields.update(normalized_fields)
+            if entity_type:
+                self.field_by_entity[entity_type].update(normalized_fields)
+            
+            for field, normalized in zip(fields, normalized_fields):
+                yield field, normalized, entity_type, 'entityPick'
     
     def _infer_entity_type(self, code: str, entity_var: str) -> str:
         """Infer entity type from variable usage context"""
-        # Look for filter patterns
-        filter_pattern = rf'entity\.type\s*===\s*[\'"`](\w+)[\'"`].*?{entity_var}'
-        match = re.search(filter_pattern, code, re.DOTALL)
-        if match:
-            return match.group(1)
-            
-        # Look for explicit type checks
-        type_pattern = rf'{entity_var}\.type\s*===\s*[\'"`](\w+)[\'"`]'
-        match = re.search(type_pattern, code)
-        if match:
-            return match.group(1)
-            
-        # Common variable name patterns
-        if 'wsbv' in entity_var.lower():
-            return 'wsbvnext'
-        elif 'mktg' in entity_var.lower():
-            return 'mktgasst'
-        elif 'uce' in entity_var.lower():
-            return 'uce'
-            
-        return 'unknown'
+        return _entity_type_for(code, entity_var)
     
     def extract_direct_property_access(self, code: str) -> List[Dict]:
         """Extract direct property access patterns"""
-        access_patterns = []
-        
+        return _access_dicts(chain(self._query_accesses(_QUERY_RE.finditer(code)),
+                                   self._prop_accesses(code, _PROP_RE.finditer(code))))
+    
+    def _query_accesses(self, matches) -> Iterator[Tuple[str, str, str, str]]:
+        """Yield field accesses for profile request query matches"""
         # Profile request query access
-        query_pattern = r'profile\.request\.query\.(\w+)'
-        for match in re.finditer(query_pattern, code):
-            field = f'request.query.{match.group(1)}'
-            access_patterns.append({
-                'field': field,
-                'normalized': field,
-                'entity_type': 'profile',
-                'access_method': 'direct'
-            })
+        for match in matches:
+            field = sys.intern(f"request.query.{match['query_field']}")
+            yield field, field, 'profile', 'direct'
+    
+    def _prop_accesses(self, code: str, matches) -> Iterator[Tuple[str, str, str, str]]:
+        """Yield field accesses for entity property access matches"""
+        fields_by_entity = defaultdict(set)
         
         # Entity property access with optional chaining
-        prop_pattern = r'(\w+)\.([a-zA-Z0-9_.?]+)(?:\s*[=!<>]|\s*\?\?|\s*&&|\s*\|\||\s*\))'
-        for match in re.finditer(prop_pattern, code):
-            var_name = match.group(1)
-            prop_path = match.group(2).replace('?.', '.')
+        for match in matches:
+            var_name = match['prop_var']
+            prop_path = match['prop_path'].replace('?.', '.')
             
             if var_name not in ['profile', 'entity', 'console', 'Object', 'Array', 'Math']:
                 entity_type = self._infer_entity_type(code, var_name)
                 normalized = self.normalize_field_path(prop_path)
                 
-                access_patterns.append({
-                    'field': prop_path,
-                    'normalized': normalized,
-                    'entity_type': entity_type,
-                    'access_method': 'direct'
-                })
+                yield prop_path, normalized, entity_type, 'direct'
                 
                 if entity_type != 'unknown':
-                    self.field_by_entity[entity_type].add(normalized)
-                    
-        return access_patterns
+                    fields_by_entity[entity_type].add(normalized)
+        
+        # Merge into the totals once the matches are exhausted
+        for entity_type, fields in fields_by_entity.items():
+            self.field_by_entity[entity_type].update(fields)
     
     def extract_destructuring_patterns(self, code: str) -> List[Dict]:
         """Extract fields from destructuring assignments"""
-        patterns = []
-        
+        return _access_dicts(self._destructuring_accesses(code, _DESTRUCT_RE.finditer(code)))
+    
+    def _destructuring_accesses(self, code: str, matches) -> Iterator[Tuple[str, str, str, str]]:
+        """Yield field accesses for destructuring matches"""
         # Match destructuring patterns
-        destruct_pattern = r'const\s*\{([^}]+)\}\s*=\s*(\w+)'
-        
-        for match in re.finditer(destruct_pattern, code):
-            fields_str = match.group(1)
-            source_var = match.group(2)
+        for match in matches:
+            fields_str = match['destruct_fields']
+            source_var = match['destruct_source']
             
             # Parse nested destructuring
             fields = self._parse_destructuring(fields_str)
             entity_type = self._infer_entity_type(code, source_var)
+            normalized_fields = [self.normalize_field_path(field_path) for field_path in fields]
             
-            for field_path in fields:
-                normalized = self.normalize_field_path(field_path)
-                patterns.append({
-                    'field': field_path,
-                    'normalized': normalized,
-                    'entity_type': entity_type,
-                    'access_method': 'destructuring'
-                })
+            for field_path, normalized in zip(fields, normalized_fields):
+                yield field_path, normalized, entity_type, 'destructuring'
                 
-                if entity_type != 'unknown':
-                    self.field_by_entity[entity_type].add(normalized)
-                    
-        return patterns
+            if entity_type != 'unknown':
+                self.field_by_entity[entity_type].update(normalized_fields)
     
     def _parse_destructuring(self, destruct_str: str) -> List[str]:
         """Parse destructuring pattern to extract field paths"""
@@ -196,17 +354,10 @@ class RADFieldAnalyzer:
         types = set()
         
         # Type equality checks
-        type_patterns = [
-            r'entity\.type\s*===\s*[\'"`](\w+)[\'"`]',
-            r'type\s*===\s*[\'"`](\w+)[\'"`]',
-            r'\.type\s*===\s*[\'"`](\w+)[\'"`]'
-        ]
-        
-        for pattern in type_patterns:
-            for match in re.finditer(pattern, code):
-                entity_type = match.group(1)
-                types.add(entity_type)
-                self.entity_types.add(entity_type)
+        for match in _TYPE_RE.finditer(code):
+            entity_type = match.group(1)
+            types.add(entity_type)
+            self.entity_types.add(entity_type)
                 
         return types
     
@@ -222,19 +373,16 @@ class RADFieldAnalyzer:
             join_info['uses_join'] = True
             
             # Extract join condition
-            join_pattern = r'joinEntities.*?\((.*?)\)\s*=>\s*\(([\s\S]*?)\)'
-            match = re.search(join_pattern, code)
+            match = _JOIN_RE.search(code)
             
             if match:
-                condition = match.group(2)
+                condition = match['condition']
                 # Extract entity relationships
-                rel_pattern = r'(\w+)\.type\s*===\s*[\'"`](\w+)[\'"`]'
-                for rel_match in re.finditer(rel_pattern, condition):
+                for rel_match in _REL_RE.finditer(condition):
                     join_info['joined_entities'].append(rel_match.group(2))
                     
                 # Extract join keys
-                key_pattern = r'(\w+)\.(\w+)\s*===\s*(\w+)\.(\w+)'
-                for key_match in re.finditer(key_pattern, condition):
+                for key_match in _KEY_RE.finditer(condition):
                     join_info['join_conditions'].append({
                         'left': f"{key_match.group(1)}.{key_match.group(2)}",
                         'right': f"{key_match.group(3)}.{key_match.group(4)}"
@@ -244,19 +392,14 @@ class RADFieldAnalyzer:
     
     def analyze_return_pattern(self, code: str) -> Dict:
         """Analyze what the synthesizer returns"""
-        if 'return []' in code or 'return[];' in code:
-            return {'type': 'empty_array', 'dynamic': False}
-            
-        if re.search(r'return\s*\[\s*\{\s*type\s*:\s*["\']none["\']', code):
-            return {'type': 'static_none', 'dynamic': False}
-            
-        if re.search(r'return\s*\[\s*\{\s*\.\.\.', code):
-            return {'type': 'spread_operator', 'dynamic': True}
-            
-        if re.search(r'return.*?ventureId', code):
-            return {'type': 'venture_based', 'dynamic': True}
-            
-        return {'type': 'dynamic', 'dynamic': True}
+        best = len(_RETURN_PRECEDENCE) - 1
+        for match in _RETURN_RE.finditer(code):
+            best = min(best, _RETURN_PRECEDENCE.index(match.lastgroup))
+            if best == 0:
+                break
+        
+        pattern_type = _RETURN_PRECEDENCE[best]
+        return {'type': pattern_type, 'dynamic': _RETURN_DYNAMIC.get(pattern_type, True)}
     
     def calculate_complexity_score(self, analysis: Dict) -> Dict:
         """Calculate complexity metrics"""
@@ -292,24 +435,41 @@ class RADFieldAnalyzer:
         }
     
     def analyze_synthesizer(self, name: str, code: str) -> Dict:
-        """Comprehensive analysis of a single synthesizer"""
+        """Comprehensive analysis of a single synthesizer
+        
+        Field accesses are returned under 'field_access_columns', a dict of
+        parallel lists keyed by _FIELD_ACCESS_KEYS. The per-access dicts under
+        'field_accesses' exist only in generate_comprehensive_report's output.
+        """
+        # Identical code yields an identical analysis; the set updates made
+        # while extracting fields would be no-ops, so only the copy is needed
+        key = blake2b(code.encode('utf-8'), digest_size=16).digest()
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            analysis = copy.deepcopy(cached)
+            analysis['name'] = name
+            self.results.append(analysis)
+            return analysis
+        
         # Extract all field access patterns
-        entity_pick_fields = self.extract_entity_pick_fields(code)
-        direct_access = self.extract_direct_property_access(code)
-        destructured = self.extract_destructuring_patterns(code)
+        all_field_accesses = list(self.scan_field_accesses(code))
         
-        # Combine all field accesses
-        all_field_accesses = entity_pick_fields + direct_access + destructured
+        # Combine all field accesses, kept as one list per attribute; the
+        # per-access dicts are only rebuilt for the exported report
+        field_access_columns = {
+            key: [access[i] for access in all_field_accesses]
+            for i, key in enumerate(_FIELD_ACCESS_KEYS)
+        }
         
         # Extract unique fields
-        all_fields = set(f['normalized'] for f in all_field_accesses)
+        all_fields = set(field_access_columns['normalized'])
         
         # Analyze patterns
         analysis = {
             'name': name,
             'entity_types': list(self.extract_entity_types(code)),
             'all_fields': list(all_fields),
-            'field_accesses': all_field_accesses,
+            'field_access_columns': field_access_columns,
             'join_info': self.detect_join_patterns(code),
             'return_pattern': self.analyze_return_pattern(code),
             'code_length': len(code),
@@ -321,25 +481,65 @@ class RADFieldAnalyzer:
         # Calculate complexity
         analysis['complexity'] = self.calculate_complexity_score(analysis)
         
+        self._analysis_cache[key] = copy.deepcopy(analysis)
         self.results.append(analysis)
         return analysis
     
+    def analyze_synthesizers(self, synthesizers: Iterator[Tuple[str, str]], jobs: int = 1) -> None:
+        """Analyze (name, code) pairs in order, using worker processes when jobs > 1"""
+        if jobs <= 1:
+            for name, code in synthesizers:
+                self.analyze_synthesizer(name, code)
+            return
+            
+        # Each distinct body is analyzed once by a worker; state deltas are
+        # merged in first-seen order, so the report holds the same data as a
+        # serial run though lists built from sets may be ordered differently
+        synthesizers = [(name, code, blake2b(code.encode('utf-8'), digest_size=16).digest())
+                        for name, code in synthesizers]
+        pending = {}
+        for _, code, key in synthesizers:
+            if key not in self._analysis_cache and key not in pending:
+                pending[key] = code
+                
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            analyses = executor.map(_analyze_code, pending.values(), chunksize=16)
+            for key, (analysis, state) in zip(pending, analyses):
+                self._merge_state(state)
+                self._analysis_cache[key] = analysis
+                
+        for name, _, key in synthesizers:
+            analysis = copy.deepcopy(self._analysis_cache[key])
+            analysis['name'] = name
+            self.results.append(analysis)
+    
+    def _shared_state(self) -> Tuple:
+        """Side-effect state accumulated across synthesizers"""
+        return self.all_fields, self.entity_types, self.field_variations, self.field_by_entity
+    
+    def _merge_state(self, state: Tuple) -> None:
+        """Fold another analyzer's side-effect state into this one"""
+        all_fields, entity_types, field_variations, field_by_entity = state
+        self.all_fields.update(all_fields)
+        self.entity_types.update(entity_types)
+        for field, variations in field_variations.items():
+            self.field_variations[field].update(variations)
+        for entity_type, fields in field_by_entity.items():
+            self.field_by_entity[entity_type].update(fields)
+    
     def generate_comprehensive_report(self) -> Dict:
         """Generate detailed analysis report"""
         # Field usage statistics
-        field_counter = Counter()
-        entity_field_map = defaultdict(Counter)
-        access_method_stats = Counter()
+        columns = [r['field_access_columns'] for r in self.results]
+        field_counter = Counter(chain.from_iterable(c['normalized'] for c in columns))
+        access_method_stats = Counter(chain.from_iterable(c['access_method'] for c in columns))
+        pair_counter = Counter(chain.from_iterable(
+            zip(c['entity_type'], c['normalized']) for c in columns
+        ))
         
-        for result in self.results:
-            for field_access in result['field_accesses']:
-                field = field_access['normalized']
-                entity = field_access['entity_type']
-                method = field_access['access_method']
-                
-                field_counter[field] += 1
-                entity_field_map[entity][field] += 1
-                access_method_stats[method] += 1
+        entity_field_map = defaultdict(Counter)
+        for (entity, field), count in pair_counter.items():
+            entity_field_map[entity][field] = count
         
         # Common field patterns
         common_patterns = self._identify_common_patterns(field_counter)
@@ -361,11 +561,22 @@ class RADFieldAnalyzer:
                 'common_patterns': common_patterns,
             },
             'entity_relationships': self._analyze_entity_relationships(),
-            'synthesizer_details': self.results,
+            'synthesizer_details': [self._expand_field_accesses(r) for r in self.results],
         }
         
         return report
     
+    def _expand_field_accesses(self, analysis: Dict) -> Dict:
+        """Copy an analysis with its field access columns rebuilt as per-access dicts"""
+        expanded = {}
+        for key, value in analysis.items():
+            if key == 'field_access_columns':
+                rows = zip(*(value[column] for column in _FIELD_ACCESS_KEYS))
+                expanded['field_accesses'] = [dict(zip(_FIELD_ACCESS_KEYS, row)) for row in rows]
+            else:
+                expanded[key] = value
+        return expanded
+    
     def _identify_common_patterns(self, field_counter: Counter) -> Dict:
         """Identify common data access patterns"""
         patterns = {
@@ -380,20 +591,9 @@ class RADFieldAnalyzer:
         }
         
         for field, count in field_counter.items():
-            if 'billing' in field or 'payment' in field:
-                patterns['billing'].append((field, count))
-            elif 'entitlement' in field or 'current' in field:
-                patterns['entitlements'].append((field, count))
-            elif 'feature' in field or 'widget' in field:
-                patterns['features'].append((field, count))
-            elif 'facebook' in field or 'instagram' in field or 'social' in field:
-                patterns['social_media'].append((field, count))
-            elif 'product' in field or 'commerce' in field or 'ols' in field:
-                patterns['commerce'].append((field, count))
-            elif 'appointment' in field or 'ola' in field or 'service' in field:
-                patterns['appointments'].append((field, count))
-            elif 'account' in field or 'shopper' in field:
-                patterns['authentication'].append((field, count))
+            category = _common_pattern_for(field)
+            if category:
+                patterns[category].append((field, count))
                 
         # Sort each pattern list by usage count
         for key in patterns:
@@ -426,44 +626,23 @@ class RADFieldAnalyzer:
         dist = Counter(r['return_pattern']['type'] for r in self.results)
         return dict(dist)
     
-    def parse_rad_file(self, filepath: str) -> List[Tuple[str, str]]:
-        """Parse RAD file and extract synthesizer name and code pairs"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        synthesizers = []
-        sections = content.split('## ')
-        
-        for section in sections[1:]:  # Skip the header
-            lines = section.strip().split('\n')
-            if lines:
-                name = lines[0].strip()
-                
-                # Find JavaScript code block
-                code_start = section.find('```javascript')
-                code_end = section.find('```', code_start + 1)
-                
-                if code_start != -1 and code_end != -1:
-                    code = section[code_start + 13:code_end].strip()
-                    synthesizers.append((name, code))
-                    
-        return synthesizers
+    def parse_rad_file(self, filepath: str) -> Iterator[Tuple[str, str]]:
+        """Parse RAD file and yield synthesizer name and code pairs"""
+        # Large files are memory-mapped rather than read, and only the names
+        # and code blocks are decoded; only the first JavaScript block under
+        # each heading is used
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+                yield from _iter_synthesizers(f.read())
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    yield from _iter_synthesizers(mm)
     
     def export_report(self, report: Dict, format: str = 'json') -> str:
         """Export report in various formats"""
         if format == 'json':
-            # Convert sets to lists for JSON serialization
-            def convert_sets(obj):
-                if isinstance(obj, set):
-                    return list(obj)
-                elif isinstance(obj, dict):
-                    return {k: convert_sets(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [convert_sets(item) for item in obj]
-                return obj
-            
-            serializable_report = convert_sets(report)
-            return json.dumps(serializable_report, indent=2)
+            # Sets are converted to lists by the encoder as it reaches them
+            return _dumps(report)
         
         elif format == 'markdown':
             md = "# RAD Synthesizer Analysis Report\n\n"
@@ -516,17 +695,17 @@ class RADFieldAnalyzer:
             # Header
             writer.writerow(['Synthesizer', 'Complexity', 'Entity Types', 'Field Count', 'Uses Join', 'Return Type'])
             
-            # Data rows
-            for synth in report['synthesizer_details']:
-                writer.writerow([
-                    synth['name'],
-                    synth['complexity']['level'],
-                    ', '.join(synth['entity_types']),
-                    len(synth['all_fields']),
-                    synth['join_info']['uses_join'],
-                    synth['return_pattern']['type']
-                ])
-                
+            # Data rows, streamed to the writer in one call
+            writer.writerows(
+                (synth['name'],
+                 synth['complexity']['level'],
+                 ', '.join(synth['entity_types']),
+                 len(synth['all_fields']),
+                 synth['join_info']['uses_join'],
+                 synth['return_pattern']['type'])
+                for synth in report['synthesizer_details']
+            )
+            
             return output.getvalue()
         
         return ""
@@ -538,6 +717,8 @@ def main():
     parser.add_argument('-f', '--format', choices=['json', 'markdown', 'csv'], 
                        default='markdown', help='Output format')
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                       help='Worker processes for synthesizer analysis')
     
     args = parser.parse_args()
     
@@ -548,13 +729,10 @@ def main():
     if args.verbose:
         print(f"Analyzing RAD file: {args.input}")
         
-    synthesizers = analyzer.parse_rad_file(args.input)
+    analyzer.analyze_synthesizers(analyzer.parse_rad_file(args.input), args.jobs)
     
     if args.verbose:
-        print(f"Found {len(synthesizers)} synthesizers")
-    
-    for name, code in synthesizers:
-        analyzer.analyze_synthesizer(name, code)
+        print(f"Found {len(analyzer.results)} synthesizers")
     
     # Generate report
     report = analyzer.generate_comprehensive_report()
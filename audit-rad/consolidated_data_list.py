@@ -4,143 +4,135 @@ Create a simple consolidated list of all unique data fields
 """
 
 import json
+import heapq
 import argparse
 from collections import defaultdict
+from typing import Dict, Iterator, TextIO, Tuple
 
-def create_consolidated_list(json_report_path: str):
-    """Create a simple, organized list of all unique data"""
+from field_scan import keyword_scanner, tally_fields
+
+try:
+    import ijson
+except ImportError:  # optional, the whole report is loaded with json without it
+    ijson = None
+
+# Keywords the category rules look for; 'entitlement' is matched in any case
+_KEYWORDS = (
+    'accountId', '.id', '.type',
+    '.current', '.transitionable', '.available',
+    'billing', 'payment', 'commitment', 'autoRenew', 'shopperId',
+    'website', 'published', 'widget', 'domain', 'features.', 'websiteType',
+    'facebook', 'instagram', 'social', 'gem', 'email', 'subscriber', 'gmb', 'yelp',
+    'product', 'commerce', 'ols', 'marketplace', 'store',
+    'appointment', 'ola', 'service', 'calendar', 'booking',
+    'customer', 'contact', 'intention',
+)
+_keywords_in = keyword_scanner(_KEYWORDS, 'entitlement')
+
+# Categories in priority order: the keywords that select each one, its
+# subcategories in priority order and the subcategory when none of them match
+_CATEGORY_RULES = (
+    ('1. Core Identity & References', frozenset(('accountId', '.id', '.type')),
+     (('accountId', 'Account IDs'), ('.id', 'Entity IDs'), ('.type', 'Entity Types')),
+     'Other Identity'),
+    ('2. Entitlements & Permissions', frozenset(('entitlement',)),
+     (('.current', 'Current Entitlements'), ('.transitionable', 'Available Entitlements'),
+      ('.available', 'Available Entitlements')),
+     'General Entitlements'),
+    ('3. Billing & Account Management', frozenset(('billing', 'payment', 'commitment', 'autoRenew', 'shopperId')),
+     (), 'Billing Details'),
+    ('4. Website Configuration', frozenset(('website', 'published', 'widget', 'domain', 'features.')),
+     (('widget', 'Widgets & Features'), ('published', 'Publishing Status'), ('websiteType', 'Website Type')),
+     'Other Settings'),
+    ('5. Marketing & Social Media', frozenset(('facebook', 'instagram', 'social', 'gem', 'email', 'subscriber')),
+     (('facebook', 'Facebook'), ('instagram', 'Instagram'), ('gem', 'Email Marketing'),
+      ('email', 'Email Marketing'), ('subscriber', 'Email Marketing'), ('gmb', 'Google Business'),
+      ('yelp', 'Yelp')),
+     'Other Social'),
+    ('6. E-commerce', frozenset(('product', 'commerce', 'ols', 'marketplace', 'store')),
+     (('product', 'Products'), ('marketplace', 'Marketplaces')),
+     'Store Settings'),
+    ('7. Appointments & Services', frozenset(('appointment', 'ola', 'service', 'calendar', 'booking')),
+     (('service', 'Services'), ('calendar', 'Scheduling'), ('booking', 'Scheduling')),
+     'General Appointments'),
+    ('8. Navigation & Links', frozenset(('links.',)), (), 'Action Links'),
+    ('9. Customer Data', frozenset(('customer', 'contact', 'intention')), (), 'Customer Info'),
+)
+
+def _categorize(field: str) -> Tuple[str, str]:
+    """Determine category and subcategory of a field"""
+    found = _keywords_in(field)
+    # The bare 'id' and 'type' fields and link paths count as keywords of their own
+    if field == 'id' or field == 'type':
+        found.add('.' + field)
+    if field.startswith('links.'):
+        found.add('links.')
     
-    with open(json_report_path, 'r') as f:
-        report = json.load(f)
+    for category, keywords, subcategories, default in _CATEGORY_RULES:
+        if not found.isdisjoint(keywords):
+            for keyword, subcategory in subcategories:
+                if keyword in found:
+                    return category, subcategory
+            return category, default
+    return '10. Other Data', 'Miscellaneous'
+
+def _iter_synthesizers(json_report_path: str) -> Iterator[Dict]:
+    """Yield the synthesizer details of a report, one at a time when ijson is installed"""
+    if ijson is not None:
+        with open(json_report_path, 'rb') as f:
+            yield from ijson.items(f, 'synthesizer_details.item')
+    else:
+        with open(json_report_path, 'r') as f:
+            report = json.load(f)
+        yield from report['synthesizer_details']
+
+def create_consolidated_list(json_report_path: str, out: TextIO) -> None:
+    """Create a simple, organized list of all unique data, written to out"""
     
     # Collect and organize all unique fields
     data_by_category = defaultdict(lambda: defaultdict(list))
     
     # Process each synthesizer to get unique fields
-    unique_fields = {}
-    for synth in report['synthesizer_details']:
-        for field_access in synth['field_accesses']:
-            field = field_access['normalized']
-            entity = field_access['entity_type']
-            
-            if field not in unique_fields:
-                unique_fields[field] = {
-                    'count': 0,
-                    'entities': set(),
-                    'synthesizers': []
-                }
-            
-            unique_fields[field]['count'] += 1
-            unique_fields[field]['entities'].add(entity)
-            unique_fields[field]['synthesizers'].append(synth['name'])
+    _, field_counts, entity_pairs, _, field_synth_masks = tally_fields(_iter_synthesizers(json_report_path))
     
-    # Categorize fields with better logic
-    for field, info in unique_fields.items():
-        # Determine category and subcategory
-        if field in ['accountId', 'id', 'type'] or 'accountId' in field or '.id' in field or '.type' in field:
-            category = '1. Core Identity & References'
-            if 'accountId' in field:
-                subcategory = 'Account IDs'
-            elif field == 'id' or '.id' in field:
-                subcategory = 'Entity IDs'
-            elif field == 'type' or '.type' in field:
-                subcategory = 'Entity Types'
-            else:
-                subcategory = 'Other Identity'
-                
-        elif 'entitlement' in field.lower() or field.startswith('entitlementData'):
-            category = '2. Entitlements & Permissions'
-            if '.current' in field:
-                subcategory = 'Current Entitlements'
-            elif '.transitionable' in field or '.available' in field:
-                subcategory = 'Available Entitlements'
-            else:
-                subcategory = 'General Entitlements'
-                
-        elif any(x in field for x in ['billing', 'payment', 'commitment', 'autoRenew', 'shopperId']):
-            category = '3. Billing & Account Management'
-            subcategory = 'Billing Details'
-            
-        elif any(x in field for x in ['website', 'published', 'widget', 'domain', 'features.']):
-            category = '4. Website Configuration'
-            if 'widget' in field:
-                subcategory = 'Widgets & Features'
-            elif 'published' in field:
-                subcategory = 'Publishing Status'
-            elif 'websiteType' in field:
-                subcategory = 'Website Type'
-            else:
-                subcategory = 'Other Settings'
-                
-        elif any(x in field for x in ['facebook', 'instagram', 'social', 'gem', 'email', 'subscriber']):
-            category = '5. Marketing & Social Media'
-            if 'facebook' in field:
-                subcategory = 'Facebook'
-            elif 'instagram' in field:
-                subcategory = 'Instagram'
-            elif 'gem' in field or 'email' in field or 'subscriber' in field:
-                subcategory = 'Email Marketing'
-            elif 'gmb' in field:
-                subcategory = 'Google Business'
-            elif 'yelp' in field:
-                subcategory = 'Yelp'
-            else:
-                subcategory = 'Other Social'
-                
-        elif any(x in field for x in ['product', 'commerce', 'ols', 'marketplace', 'store']):
-            category = '6. E-commerce'
-            if 'product' in field:
-                subcategory = 'Products'
-            elif 'marketplace' in field:
-                subcategory = 'Marketplaces'
-            else:
-                subcategory = 'Store Settings'
-                
-        elif any(x in field for x in ['appointment', 'ola', 'service', 'calendar', 'booking']):
-            category = '7. Appointments & Services'
-            if 'service' in field:
-                subcategory = 'Services'
-            elif 'calendar' in field or 'booking' in field:
-                subcategory = 'Scheduling'
-            else:
-                subcategory = 'General Appointments'
-                
-        elif field.startswith('links.'):
-            category = '8. Navigation & Links'
-            subcategory = 'Action Links'
-            
-        elif any(x in field for x in ['customer', 'contact', 'intention']):
-            category = '9. Customer Data'
-            subcategory = 'Customer Info'
-            
-        else:
-            category = '10. Other Data'
-            subcategory = 'Miscellaneous'
+    # Entity bits follow name order, so decoding a mask low bit first gives sorted names
+    entity_names = sorted({entity for _, entity in entity_pairs})
+    entity_bits = {entity: 1 << i for i, entity in enumerate(entity_names)}
+    field_entity_masks = defaultdict(int)
+    for field, entity in entity_pairs:
+        field_entity_masks[field] |= entity_bits[entity]
+    
+    # Distinct synthesizer counts, computed once for the markers and the frequency groups
+    synth_counts = {field: bin(mask).count('1') for field, mask in field_synth_masks.items()}
+    
+    # Categorize fields with better logic, most used first so every
+    # subcategory list comes out already sorted by usage count
+    for field, count in field_counts.most_common():
+        category, subcategory = _categorize(field)
         
         data_by_category[category][subcategory].append({
             'field': field,
-            'count': info['count'],
-            'entities': sorted(info['entities']),
-            'synthesizer_count': len(set(info['synthesizers']))
+            'count': count,
+            'entities': [entity for i, entity in enumerate(entity_names)
+                         if field_entity_masks[field] >> i & 1],
+            'synthesizer_count': synth_counts[field]
         })
     
     # Generate output
-    output = "# Complete List of Unique Data Fields Used by RAD Synthesizers\n\n"
-    output += f"**Total: {len(unique_fields)} unique data fields** across 144 synthesizers\n\n"
+    write = out.write
+    write("# Complete List of Unique Data Fields Used by RAD Synthesizers\n\n")
+    write(f"**Total: {len(field_counts)} unique data fields** across 144 synthesizers\n\n")
     
     # Sort categories
     for category in sorted(data_by_category.keys()):
-        output += f"## {category}\n\n"
+        write(f"## {category}\n\n")
         
         subcategories = data_by_category[category]
         
         for subcategory in sorted(subcategories.keys()):
             fields = subcategories[subcategory]
             
-            # Sort fields by usage count
-            fields.sort(key=lambda x: x['count'], reverse=True)
-            
-            output += f"### {subcategory}\n\n"
+            write(f"### {subcategory}\n\n")
             
             for field_info in fields:
                 field = field_info['field']
@@ -155,17 +147,13 @@ def create_consolidated_list(json_report_path: str):
                 else:
                     marker = "🟢"  # Low usage
                 
-                output += f"{marker} **`{field}`** - Used by {count} synthesizers"
-                
-                if entities and entities != ['unknown']:
-                    output += f" [{', '.join(entities)}]"
-                
-                output += "\n"
+                suffix = f" [{', '.join(entities)}]" if entities and entities != ['unknown'] else ""
+                write(f"{marker} **`{field}`** - Used by {count} synthesizers{suffix}\n")
             
-            output += "\n"
+            write("\n")
     
     # Add summary table
-    output += "## Summary by Usage Frequency\n\n"
+    write("## Summary by Usage Frequency\n\n")
     
     # Group by usage frequency
     frequency_groups = {
@@ -176,8 +164,7 @@ def create_consolidated_list(json_report_path: str):
         'Rare (1 synthesizer)': []
     }
     
-    for field, info in unique_fields.items():
-        count = len(set(info['synthesizers']))
+    for field, count in synth_counts.items():
         if count >= 20:
             frequency_groups['Very Common (20+ synthesizers)'].append(field)
         elif count >= 10:
@@ -191,18 +178,16 @@ def create_consolidated_list(json_report_path: str):
     
     for group, fields in frequency_groups.items():
         if fields:
-            output += f"### {group} ({len(fields)} fields)\n"
+            write(f"### {group} ({len(fields)} fields)\n")
             
             # Show first 10 and count
-            for field in sorted(fields)[:10]:
-                output += f"- `{field}`\n"
+            for field in heapq.nsmallest(10, fields):
+                write(f"- `{field}`\n")
             
             if len(fields) > 10:
-                output += f"- _... and {len(fields) - 10} more_\n"
+                write(f"- _... and {len(fields) - 10} more_\n")
             
-            output += "\n"
-    
-    return output
+            write("\n")
 
 def main():
     parser = argparse.ArgumentParser(description='Create consolidated list of unique data fields')
@@ -213,10 +198,8 @@ def main():
     args = parser.parse_args()
     
     # Generate list
-    consolidated_list = create_consolidated_list(args.input)
-    
-    with open(args.output, 'w') as f:
-        f.write(consolidated_list)
+    with open(args.output, 'w', buffering=1 << 20) as f:
+        create_consolidated_list(args.input, f)
     
     print(f"Consolidated list saved to: {args.output}")
 
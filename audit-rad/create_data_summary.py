@@ -5,64 +5,106 @@ Create a visual summary of unique data fields with better organization
 
 import json
 import argparse
-from collections import defaultdict, Counter
+from collections import defaultdict
+from functools import reduce
+from operator import and_, itemgetter
+from typing import Dict, Iterator, Optional, TextIO
 
-def create_visual_summary(json_report_path: str):
-    """Create a more visual and organized summary"""
+from field_scan import keyword_scanner, tally_fields
+
+try:
+    import ijson
+except ImportError:  # optional, the whole report is loaded with json without it
+    ijson = None
+
+# Keywords the category rules look for; 'account' is matched in any case
+_KEYWORDS = (
+    'billing', 'payment', 'commitment', 'autoRenew',
+    'entitlement', 'current.',
+    'website', 'published', 'widget', 'domain',
+    'facebook', 'instagram', 'social', 'gem', 'email',
+    'product', 'commerce', 'ols', 'marketplace',
+    'appointment', 'ola', 'service', 'calendar',
+    'customer', 'contact', 'intention',
+)
+_keywords_in = keyword_scanner(_KEYWORDS, 'account')
+
+# Categories in priority order with the keywords that select them
+_CATEGORY_RULES = (
+    ('Billing & Payments', frozenset(('billing', 'payment', 'commitment', 'autoRenew'))),
+    ('Feature Entitlements', frozenset(('entitlement', 'current.'))),
+    ('Website Settings', frozenset(('website', 'published', 'widget', 'domain'))),
+    ('Marketing & Social', frozenset(('facebook', 'instagram', 'social', 'gem', 'email'))),
+    ('E-commerce', frozenset(('product', 'commerce', 'ols', 'marketplace'))),
+    ('Appointments', frozenset(('appointment', 'ola', 'service', 'calendar'))),
+    ('Customer Data', frozenset(('customer', 'contact', 'intention'))),
+)
+
+def _categorize(field: str) -> str:
+    """Determine the data category of a field from one keyword scan"""
+    found = _keywords_in(field)
+    if 'account' in found or field in ['id', 'type']:
+        return 'Core Identity'
+    for category, keywords in _CATEGORY_RULES:
+        if not found.isdisjoint(keywords):
+            return category
+    if field.startswith('links.'):
+        return 'Navigation Links'
+    return 'Other Data'
+
+def _iter_synthesizers(json_report_path: str, report: Optional[Dict]) -> Iterator[Dict]:
+    """Yield synthesizer details from a loaded report, or stream them with ijson"""
+    if report is not None:
+        yield from report['synthesizer_details']
+    else:
+        with open(json_report_path, 'rb') as f:
+            yield from ijson.items(f, 'synthesizer_details.item')
+
+def _field_variations(json_report_path: str, report: Optional[Dict]) -> Dict:
+    """Return the field variations of a loaded report, or stream them with ijson"""
+    if report is not None:
+        return report['field_analysis']['field_variations']
+    with open(json_report_path, 'rb') as f:
+        return dict(ijson.kvitems(f, 'field_analysis.field_variations'))
+
+def create_visual_summary(json_report_path: str, out: TextIO) -> None:
+    """Create a more visual and organized summary, written to out"""
     
-    with open(json_report_path, 'r') as f:
-        report = json.load(f)
+    # Without ijson the report is loaded whole, otherwise it is streamed
+    report = None
+    if ijson is None:
+        with open(json_report_path, 'r') as f:
+            report = json.load(f)
     
     # Collect all field usage
-    field_usage = Counter()
+    synthesizer_count, field_usage, entity_pairs, synth_names, field_synths = tally_fields(
+        _iter_synthesizers(json_report_path, report))
     field_categories = defaultdict(set)
     field_entity_map = defaultdict(set)
-    synthesizer_count = len(report['synthesizer_details'])
-    
-    for synth in report['synthesizer_details']:
-        for field_access in synth['field_accesses']:
-            field = field_access['normalized']
-            entity = field_access['entity_type']
-            
-            field_usage[field] += 1
-            field_entity_map[field].add(entity)
-            
-            # Better categorization
-            if 'account' in field.lower() or field in ['id', 'type']:
-                field_categories['Core Identity'].add(field)
-            elif any(x in field for x in ['billing', 'payment', 'commitment', 'autoRenew']):
-                field_categories['Billing & Payments'].add(field)
-            elif any(x in field for x in ['entitlement', 'current.']):
-                field_categories['Feature Entitlements'].add(field)
-            elif any(x in field for x in ['website', 'published', 'widget', 'domain']):
-                field_categories['Website Settings'].add(field)
-            elif any(x in field for x in ['facebook', 'instagram', 'social', 'gem', 'email']):
-                field_categories['Marketing & Social'].add(field)
-            elif any(x in field for x in ['product', 'commerce', 'ols', 'marketplace']):
-                field_categories['E-commerce'].add(field)
-            elif any(x in field for x in ['appointment', 'ola', 'service', 'calendar']):
-                field_categories['Appointments'].add(field)
-            elif any(x in field for x in ['customer', 'contact', 'intention']):
-                field_categories['Customer Data'].add(field)
-            elif field.startswith('links.'):
-                field_categories['Navigation Links'].add(field)
-            else:
-                field_categories['Other Data'].add(field)
+    
+    for field, entity in entity_pairs:
+        field_entity_map[field].add(entity)
+    
+    # Better categorization, once per unique field in first-seen order
+    for field in field_usage:
+        field_categories[_categorize(field)].add(field)
     
     # Generate visual summary
-    output = "# RAD Data Usage - Visual Summary\n\n"
-    output += f"Analyzing **{synthesizer_count} synthesizers** using **{len(field_usage)} unique data fields**\n\n"
+    write = out.write
+    write("# RAD Data Usage - Visual Summary\n\n")
+    write(f"Analyzing **{synthesizer_count} synthesizers** using **{len(field_usage)} unique data fields**\n\n")
     
     # Most common data - visual bar chart
-    output += "## 📊 Most Commonly Used Data\n\n"
-    output += "```\n"
+    write("## 📊 Most Commonly Used Data\n\n")
+    write("```\n")
     max_count = max(field_usage.values())
-    for field, count in field_usage.most_common(20):
-        percentage = (count / synthesizer_count) * 100
-        bar_length = int((count / max_count) * 40)
-        bar = '█' * bar_length
-        output += f"{field:<35} {bar} {count:3d} ({percentage:3.0f}%)\n"
-    output += "```\n\n"
+    # Every bar is a slice of one full-width block
+    block = '█' * 40
+    out.writelines(
+        f"{field:<35} {block[:int((count / max_count) * 40)]} {count:3d} ({(count / synthesizer_count) * 100:3.0f}%)\n"
+        for field, count in field_usage.most_common(20)
+    )
+    write("```\n\n")
     
     # Category breakdown with emoji icons
     category_icons = {
@@ -78,7 +120,7 @@ def create_visual_summary(json_report_path: str):
         'Other Data': '📦'
     }
     
-    output += "## 📂 Data Categories Overview\n\n"
+    write("## 📂 Data Categories Overview\n\n")
     
     # Sort categories by total usage
     category_usage = {}
@@ -91,36 +133,29 @@ def create_visual_summary(json_report_path: str):
     for category, (field_count, total_usage) in sorted_cats:
         icon = category_icons.get(category, '📄')
         avg_usage = total_usage / field_count if field_count > 0 else 0
-        output += f"### {icon} {category}\n"
-        output += f"- **{field_count} unique fields** | **{total_usage} total uses** | **{avg_usage:.1f} avg uses/field**\n\n"
+        write(f"### {icon} {category}\n")
+        write(f"- **{field_count} unique fields** | **{total_usage} total uses** | **{avg_usage:.1f} avg uses/field**\n\n")
         
         # Show top fields in category
         cat_fields = [(f, field_usage[f]) for f in field_categories[category]]
         cat_fields.sort(key=lambda x: x[1], reverse=True)
         
-        output += "| Field | Usage | Synthesizers |\n"
-        output += "|-------|-------|-------------|\n"
+        write("| Field | Usage | Synthesizers |\n")
+        write("|-------|-------|-------------|\n")
         
         for field, count in cat_fields[:5]:
             entities = ', '.join(sorted(field_entity_map[field]))
-            output += f"| `{field}` | {count} | {entities} |\n"
+            write(f"| `{field}` | {count} | {entities} |\n")
         
         if len(cat_fields) > 5:
-            output += f"| ... +{len(cat_fields) - 5} more fields | | |\n"
+            write(f"| ... +{len(cat_fields) - 5} more fields | | |\n")
         
-        output += "\n"
+        write("\n")
     
     # Common data patterns
-    output += "## 🔄 Common Data Access Patterns\n\n"
-    
-    # Find synthesizers that use similar data
-    synth_fields = defaultdict(set)
-    for synth in report['synthesizer_details']:
-        name = synth['name']
-        for field_access in synth['field_accesses']:
-            synth_fields[name].add(field_access['normalized'])
+    write("## 🔄 Common Data Access Patterns\n\n")
     
-    # Identify common patterns
+    # Identify common patterns among the per-synthesizer field sets
     patterns = {
         'Basic Website Info': {'accountId', 'features.published', 'features.websiteType'},
         'E-commerce Setup': {'accountId', 'entitlementData', 'ols.products.count', 'links.olsAddProducts'},
@@ -130,70 +165,84 @@ def create_visual_summary(json_report_path: str):
         'Marketing Email': {'accountId', 'gem.subscriberCount', 'gem.hasSent', 'links.composeCampaign'},
     }
     
+    # A pattern's synthesizers are the AND of its fields' masks; only the
+    # examples shown are decoded, lowest bit (first seen) first
     for pattern_name, pattern_fields in patterns.items():
-        matching_synths = []
-        for synth, fields in synth_fields.items():
-            if pattern_fields.issubset(fields):
-                matching_synths.append(synth)
+        matched = 0
+        if pattern_fields.issubset(field_synths):
+            matched = reduce(and_, [field_synths[field] for field in pattern_fields])
+        match_count = bin(matched).count('1')
         
-        if matching_synths:
-            output += f"### {pattern_name}\n"
-            output += f"**{len(matching_synths)} synthesizers** use this data combination:\n"
-            output += "- Fields: " + ", ".join(f"`{f}`" for f in sorted(pattern_fields)) + "\n"
-            output += f"- Examples: {', '.join(matching_synths[:3])}"
-            if len(matching_synths) > 3:
-                output += f" (+{len(matching_synths) - 3} more)"
-            output += "\n\n"
+        examples = []
+        while matched and len(examples) < 3:
+            lowest = matched & -matched
+            examples.append(synth_names[lowest.bit_length() - 1])
+            matched ^= lowest
+        
+        if match_count:
+            write(f"### {pattern_name}\n")
+            write(f"**{match_count} synthesizers** use this data combination:\n")
+            write("- Fields: " + ", ".join(f"`{f}`" for f in sorted(pattern_fields)) + "\n")
+            write(f"- Examples: {', '.join(examples)}")
+            if match_count > 3:
+                write(f" (+{match_count - 3} more)")
+            write("\n\n")
     
-    # Data sharing matrix
-    output += "## 🔗 Most Shared Data Fields\n\n"
-    output += "Fields used by 10+ synthesizers (strong indicators of core data):\n\n"
+    # One pass over the tallies collects the shared, critical and rare fields,
+    # with the critical threshold computed once
+    critical_threshold = synthesizer_count * 0.5
+    shared_fields = []
+    critical_fields = []
+    rare_count = 0
+    for field, count in field_usage.items():
+        if count >= 10:
+            shared_fields.append((field, count))
+        if count > critical_threshold:
+            critical_fields.append((field, count))
+        if count == 1:
+            rare_count += 1
+    shared_fields.sort(key=itemgetter(1), reverse=True)
     
-    shared_fields = [(f, c) for f, c in field_usage.items() if c >= 10]
-    shared_fields.sort(key=lambda x: x[1], reverse=True)
+    # Data sharing matrix
+    write("## 🔗 Most Shared Data Fields\n\n")
+    write("Fields used by 10+ synthesizers (strong indicators of core data):\n\n")
     
-    output += "```mermaid\ngraph LR\n"
+    write("```mermaid\ngraph LR\n")
     for i, (field, count) in enumerate(shared_fields[:10]):
         size = "large" if count > 50 else "medium" if count > 20 else "small"
-        output += f"    F{i}[\"{field}<br/>{count} uses\"]\n"
-        output += f"    style F{i} fill:#"
         if count > 50:
-            output += "ff6b6b"  # Red for high usage
+            color = "ff6b6b"  # Red for high usage
         elif count > 20:
-            output += "4ecdc4"  # Green for medium usage  
+            color = "4ecdc4"  # Green for medium usage  
         else:
-            output += "95e1d3"  # Blue for lower usage
-        output += "\n"
-    output += "```\n\n"
+            color = "95e1d3"  # Blue for lower usage
+        write(f"    F{i}[\"{field}<br/>{count} uses\"]\n    style F{i} fill:#{color}\n")
+    write("```\n\n")
     
     # Recommendations
-    output += "## 💡 Key Insights\n\n"
+    write("## 💡 Key Insights\n\n")
     
     # Most critical fields
-    critical_fields = [f for f, c in field_usage.items() if c > synthesizer_count * 0.5]
     if critical_fields:
-        output += f"### Critical Data (used by >50% of synthesizers)\n"
-        for field in sorted(critical_fields):
-            percentage = (field_usage[field] / synthesizer_count) * 100
-            output += f"- `{field}` - {percentage:.0f}% of synthesizers\n"
-        output += "\n"
+        write(f"### Critical Data (used by >50% of synthesizers)\n")
+        for field, count in sorted(critical_fields):
+            percentage = (count / synthesizer_count) * 100
+            write(f"- `{field}` - {percentage:.0f}% of synthesizers\n")
+        write("\n")
     
     # Rarely used fields
-    rare_fields = [f for f, c in field_usage.items() if c == 1]
-    if rare_fields:
-        output += f"### Rarely Used Data ({len(rare_fields)} fields used by only 1 synthesizer)\n"
-        output += "Consider if these are still needed or can be consolidated.\n\n"
+    if rare_count:
+        write(f"### Rarely Used Data ({rare_count} fields used by only 1 synthesizer)\n")
+        write("Consider if these are still needed or can be consolidated.\n\n")
     
     # Field variations
-    variations = report['field_analysis']['field_variations']
+    variations = _field_variations(json_report_path, report)
     high_variation = [(f, len(v)) for f, v in variations.items() if len(v) > 2]
     if high_variation:
-        output += "### Fields with Multiple Access Patterns\n"
-        output += "These fields are accessed inconsistently and should be standardized:\n"
+        write("### Fields with Multiple Access Patterns\n")
+        write("These fields are accessed inconsistently and should be standardized:\n")
         for field, var_count in sorted(high_variation, key=lambda x: x[1], reverse=True)[:5]:
-            output += f"- `{field}` - {var_count} different access patterns\n"
-    
-    return output
+            write(f"- `{field}` - {var_count} different access patterns\n")
 
 def main():
     parser = argparse.ArgumentParser(description='Create visual summary of RAD data usage')
@@ -204,10 +253,8 @@ def main():
     args = parser.parse_args()
     
     # Generate summary
-    summary = create_visual_summary(args.input)
-    
-    with open(args.output, 'w') as f:
-        f.write(summary)
+    with open(args.output, 'w', buffering=1 << 20) as f:
+        create_visual_summary(args.input, f)
     
     print(f"Visual summary saved to: {args.output}")
 
@@ -8,72 +8,89 @@ class RADAnalyzer {
         this.entityTypes = new Set();
     }
 
-    // Extract field paths from entityPick calls
-    extractEntityPickFields(code) {
-        const fields = [];
-        // Match entityPick patterns with both single quotes, double quotes, and template literals
-        const entityPickRegex = /entityPick\s*\(\s*\w+\s*,\s*\[([\s\S]*?)\]\s*\)/g;
-        
-        let match;
-        while ((match = entityPickRegex.exec(code)) !== null) {
-            const fieldsStr = match[1];
-            // Extract individual field paths
-            const fieldMatches = fieldsStr.match(/['"`]([^'"`]+)['"`]/g);
-            if (fieldMatches) {
-                fieldMatches.forEach(field => {
-                    const cleanField = field.replace(/['"`]/g, '');
-                    fields.push(cleanField);
-                    this.allFields.add(cleanField);
-                });
+    // One pass finds entityPick arrays, type comparisons and profile accesses.
+    // Every kind sits in a lookahead so matches of different kinds may overlap.
+    static MASTER_RE = new RegExp('(?=' + [
+        // entityPick(x, [ ... ]); a ']' only ends the array when ')' follows
+        String.raw`(?<pick>entityPick\s*\(\s*\w+\s*,\s*\[(?<picked>[^\]]*(?:\](?!\s*\))[^\]]*)*)\]\s*\))`,
+        String.raw`(?<type>(?<entity>entity\.)?type\s*===\s*['"\`](?<typeName>[^'"\`]+)['"\`])`,
+        String.raw`(?<query>profile\.request\.query\.(?<queryName>\w+))`,
+        String.raw`(?<entities>profile\.entities\.(?<entitiesName>\w+))`
+    ].join('|') + ')', 'g');
+    static QUOTED_RE = /['"`]([^'"`]+)['"`]/g;
+    // Property chains are only tried from their first word. A start inside a word or
+    // right after 'word.' shares the chain's end with that earlier start, so it would
+    // either have been consumed by it or fail the same way
+    static ENTITY_PROP_RE = /(?<!\w|\w\.)(\w+)\.([a-zA-Z0-9_.]+)(?:\s*[=!<>]|\s*\?\?|\s*&&|\s*\|\|)/g;
+    static NESTED_RE = /(?<!\w)(\w+)\.([a-zA-Z0-9_?.]+)/g;
+
+    // Scan code once with MASTER_RE and sort the matches into buckets
+    scanCode(code) {
+        const scan = { pickFields: [], entityTypes: [], types: [], query: [], entities: [] };
+        // Like separate global scans, a match of one kind never overlaps the previous one
+        const ends = { pick: 0, entityType: 0, type: 0, query: 0, entities: 0 };
+        const take = (kind, index, text) => {
+            if (index < ends[kind]) return false;
+            ends[kind] = index + text.length;
+            return true;
+        };
+
+        for (const { index, groups } of code.matchAll(RADAnalyzer.MASTER_RE)) {
+            if (groups.pick !== undefined) {
+                if (take('pick', index, groups.pick)) {
+                    for (const field of groups.picked.matchAll(RADAnalyzer.QUOTED_RE)) {
+                        scan.pickFields.push(field[1]);
+                    }
+                }
+            } else if (groups.type !== undefined) {
+                if (groups.entity !== undefined) {
+                    if (take('entityType', index, groups.type)) scan.entityTypes.push(groups.typeName);
+                } else if (take('type', index, groups.type)) {
+                    scan.types.push(groups.typeName);
+                }
+            } else if (groups.query !== undefined) {
+                if (take('query', index, groups.query)) scan.query.push(groups.queryName);
+            } else if (take('entities', index, groups.entities)) {
+                scan.entities.push(groups.entitiesName);
             }
         }
+        return scan;
+    }
+
+    // Extract field paths from entityPick calls
+    extractEntityPickFields(code, scan = this.scanCode(code)) {
+        const fields = [];
+        scan.pickFields.forEach(field => {
+            fields.push(field);
+            this.allFields.add(field);
+        });
         return fields;
     }
 
     // Extract entity types from filter operations
-    extractEntityTypes(code) {
-        const types = [];
-        // Match entity.type === 'typename' patterns
-        const typeRegex = /entity\.type\s*===\s*['"`]([^'"`]+)['"`]/g;
-        
-        let match;
-        while ((match = typeRegex.exec(code)) !== null) {
-            types.push(match[1]);
-            this.entityTypes.add(match[1]);
-        }
-
-        // Also check for type patterns in find operations
-        const findTypeRegex = /type\s*===\s*['"`]([^'"`]+)['"`]/g;
-        while ((match = findTypeRegex.exec(code)) !== null) {
-            types.push(match[1]);
-            this.entityTypes.add(match[1]);
-        }
-
+    extractEntityTypes(code, scan = this.scanCode(code)) {
+        // entity.type === 'typename' patterns first, then type patterns in find operations
+        const types = [...scan.entityTypes, ...scan.types];
+        types.forEach(type => this.entityTypes.add(type));
         return [...new Set(types)];
     }
 
     // Extract direct property access patterns
-    extractDirectAccess(code) {
+    extractDirectAccess(code, scan = this.scanCode(code)) {
         const accessPatterns = [];
         
         // Match profile.request.query patterns
-        const queryRegex = /profile\.request\.query\.(\w+)/g;
-        let match;
-        while ((match = queryRegex.exec(code)) !== null) {
-            accessPatterns.push(`profile.request.query.${match[1]}`);
-        }
+        scan.query.forEach(name => accessPatterns.push(`profile.request.query.${name}`));
 
         // Match profile.entities patterns (not in filters)
-        const entitiesRegex = /profile\.entities\.(\w+)/g;
-        while ((match = entitiesRegex.exec(code)) !== null) {
-            if (match[1] !== 'filter' && match[1] !== 'find' && match[1] !== 'map') {
-                accessPatterns.push(`profile.entities.${match[1]}`);
+        scan.entities.forEach(name => {
+            if (name !== 'filter' && name !== 'find' && name !== 'map') {
+                accessPatterns.push(`profile.entities.${name}`);
             }
-        }
+        });
 
         // Match direct entity property access in conditions
-        const entityPropRegex = /(\w+)\.([a-zA-Z0-9_.]+)(?:\s*[=!<>]|\s*\?\?|\s*&&|\s*\|\|)/g;
-        while ((match = entityPropRegex.exec(code)) !== null) {
+        for (const match of code.matchAll(RADAnalyzer.ENTITY_PROP_RE)) {
             if (match[1] !== 'profile' && match[1] !== 'entity' && match[1] !== 'type') {
                 accessPatterns.push(`${match[1]}.${match[2]}`);
             }
@@ -106,9 +123,7 @@ class RADAnalyzer {
         const complexFields = [];
         
         // Match nested property access patterns like entity.features?.widgets
-        const nestedRegex = /(\w+)\.([a-zA-Z0-9_?.]+)/g;
-        let match;
-        while ((match = nestedRegex.exec(code)) !== null) {
+        for (const match of code.matchAll(RADAnalyzer.NESTED_RE)) {
             if (match[1] === 'entity' || match[1] === 'site' || match[1] === 'siteWithCommerce') {
                 const fieldPath = match[2].replace(/\?/g, ''); // Remove optional chaining
                 complexFields.push(fieldPath);
@@ -120,11 +135,12 @@ class RADAnalyzer {
 
     // Main analysis function
     analyzeSynthesizer(name, code) {
+        const scan = this.scanCode(code);
         const analysis = {
             name: name,
-            entityPickFields: this.extractEntityPickFields(code),
-            entityTypes: this.extractEntityTypes(code),
-            directAccess: this.extractDirectAccess(code),
+            entityPickFields: this.extractEntityPickFields(code, scan),
+            entityTypes: this.extractEntityTypes(code, scan),
+            directAccess: this.extractDirectAccess(code, scan),
             complexFieldAccess: this.extractComplexFieldAccess(code),
             usesJoinEntities: this.usesJoinEntities(code),
             returnPattern: this.getReturnPattern(code),
@@ -212,27 +228,44 @@ class RADAnalyzer {
     // Parse synthesizer definitions from the raw text
     parseSynthesizers(text) {
         const synthesizers = [];
-        const sections = text.split(/##\s+/);
-        
-        sections.forEach(section => {
-            const lines = section.trim().split('\n');
-            if (lines.length > 0) {
-                const nameMatch = lines[0].match(/^([^\s]+)/);
-                if (nameMatch) {
-                    const name = nameMatch[1];
-                    
-                    // Find JavaScript code block
-                    const codeStart = section.indexOf('```javascript');
-                    const codeEnd = section.indexOf('```', codeStart + 1);
-                    
-                    if (codeStart !== -1 && codeEnd !== -1) {
-                        const code = section.substring(codeStart + 13, codeEnd).trim();
-                        synthesizers.push({ name, code });
-                    }
+        // Sections run between '##' headers and are scanned in place instead of split out
+        const headerRegex = /##\s+/g;
+        const nameRegex = /\s*(\S+)/y;
+        const fence = '```javascript';
+        // Next opening and closing fences, only searched again once passed
+        let codeStart = text.indexOf(fence);
+        let codeEnd = 0;
+        let sectionStart = 0;
+
+        while (sectionStart <= text.length) {
+            const header = headerRegex.exec(text);
+            const sectionEnd = header ? header.index : text.length;
+
+            nameRegex.lastIndex = sectionStart;
+            const nameMatch = nameRegex.exec(text);
+            const nameStart = nameMatch ? nameRegex.lastIndex - nameMatch[1].length : sectionEnd;
+
+            if (codeStart !== -1 && codeStart < sectionStart) {
+                codeStart = text.indexOf(fence, sectionStart);
+            }
+
+            if (nameStart < sectionEnd && codeStart !== -1 && codeStart < sectionEnd) {
+                const name = text.slice(nameStart, Math.min(nameRegex.lastIndex, sectionEnd));
+
+                // Find the end of the JavaScript code block
+                if (codeEnd !== -1 && codeEnd <= codeStart) {
+                    codeEnd = text.indexOf('```', codeStart + 1);
+                }
+
+                if (codeEnd !== -1 && codeEnd < sectionEnd) {
+                    const code = text.slice(codeStart + 13, codeEnd).trim();
+                    synthesizers.push({ name, code });
                 }
             }
-        });
-        
+
+            sectionStart = header ? headerRegex.lastIndex : text.length + 1;
+        }
+
         return synthesizers;
     }
 }
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Field keyword scanning and usage tallies shared by the consolidated list
+and the visual summary
+"""
+
+import re
+import sys
+from collections import defaultdict, Counter
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+def keyword_scanner(keywords: Tuple[str, ...], any_case_keyword: str) -> Callable[[str], Set[str]]:
+    """Return a function giving every keyword occurring in a field from one scan
+
+    The keywords are matched as written and any_case_keyword in any case.
+    """
+    # Longest keyword first so each position reports its longest match; the
+    # shorter keywords it starts with are implied
+    keyword_re = re.compile('(?=(' + '|'.join(
+        re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)
+    ) + f'|(?i:{re.escape(any_case_keyword)})))')
+    implied_keywords = {
+        keyword: tuple(other for other in keywords if keyword.startswith(other))
+        for keyword in keywords
+    }
+    # Any other match is the any-case keyword, so no match needs lowering
+    any_case = (any_case_keyword,)
+
+    def keywords_in(field: str) -> Set[str]:
+        found = set()
+        for match in keyword_re.finditer(field):
+            found.update(implied_keywords.get(match.group(1)) or any_case)
+        return found
+
+    return keywords_in
+
+def tally_fields(synthesizers: Iterable[Dict]) -> Tuple[int, Counter, set, List[str], Dict[str, int]]:
+    """Tally synthesizers, field usage, (field, entity) pairs and each field's synthesizer mask"""
+    field_usage = Counter()
+    synthesizer_count = 0
+    entity_pairs = set()
+    
+    # Inverted index: synthesizers get one bit each in first-seen order, and
+    # every field keeps the mask of the synthesizers using it
+    synth_names = []
+    synth_bits = {}
+    field_synths = defaultdict(int)
+    # Bound once, the loop below runs for every synthesizer in the report
+    count_fields = field_usage.update
+    add_pairs = entity_pairs.update
+    intern = sys.intern
+    
+    # Tally each synthesizer's accesses in bulk rather than one at a time
+    for synth in synthesizers:
+        synthesizer_count += 1
+        accesses = synth['field_accesses']
+        if not accesses:
+            continue
+        fields = [field_access['normalized'] for field_access in accesses]
+        
+        count_fields(fields)
+        add_pairs(zip(fields, [intern(field_access['entity_type']) for field_access in accesses]))
+        
+        name = synth['name']
+        bit = synth_bits.get(name)
+        if bit is None:
+            bit = synth_bits[name] = 1 << len(synth_names)
+            synth_names.append(name)
+        for field in set(fields):
+            field_synths[field] |= bit
+    
+    return synthesizer_count, field_usage, entity_pairs, synth_names, field_synths
@@ -4,26 +4,107 @@ Generate a comprehensive data dictionary from RAD analysis
 Shows exactly what data each synthesizer needs in an organized format
 """
 
+import re
 import json
 import argparse
-from collections import defaultdict
-from typing import Dict, List, Set
+from collections import defaultdict, Counter
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, List, Set, TextIO, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup, the stdlib parser is used without it
+    orjson = None
+
+# Categories in priority order with the lowercase terms that select them
+_CATEGORY_TERMS = (
+    ('Identity & Authentication', ('account', 'shopper', 'id')),
+    ('Billing & Payments', ('billing', 'payment', 'commitment', 'autorenew')),
+    ('Entitlements & Permissions', ('entitlement', 'current', 'transitionable')),
+    ('Features & Configuration', ('feature', 'widget', 'published')),
+    ('Social Media & Marketing', ('facebook', 'instagram', 'social', 'gem')),
+    ('Commerce & Products', ('product', 'commerce', 'ols', 'marketplace')),
+    ('Appointments & Services', ('appointment', 'ola', 'service', 'calendar')),
+    ('Status & Types', ('type', 'status')),
+)
+_TERM_RANK = {term: rank for rank, (_, terms) in enumerate(_CATEGORY_TERMS) for term in terms}
+# One lookahead scan reports the longest term at each position; the terms it
+# starts with are also present, so a match ranks as the best of them
+_TERM_RE = re.compile('(?=(' + '|'.join(
+    re.escape(term) for term in sorted(_TERM_RANK, key=len, reverse=True)
+) + '))')
+_MATCH_RANK = {
+    term: min(rank for other, rank in _TERM_RANK.items() if term.startswith(other))
+    for term in _TERM_RANK
+}
+
+_DESCRIPTIONS = {
+    'accountId': 'Unique identifier for the account',
+    'id': 'Entity unique identifier',
+    'type': 'Entity type identifier (e.g., wsbvnext, mktgasst)',
+    'entitlementData': 'Complete entitlement information for the account',
+    'entitlements.current': 'Currently active entitlements',
+    'websiteType': 'Type of website (e.g., gocentral)',
+    'features.published': 'Whether the website is published',
+    'features.widgets': 'List of enabled widgets on the website',
+    'billing.commitment': 'Billing commitment type',
+    'account.paymentStatus': 'Current payment status of the account',
+    'social.lastFacebookPost': 'Date of last Facebook post',
+    'social.lastInstagramPost': 'Date of last Instagram post',
+    'commerce.productCount': 'Number of products in the commerce store',
+    'appointments.serviceCount': 'Number of services available for appointments',
+    'appointments.status': 'Status of the appointments system',
+    'customerIntentions': 'Customer intent data for personalization',
+    'features.planType': 'Type of plan the customer is on',
+}
+
+@lru_cache(maxsize=4096)
+def _categorize(field: str) -> str:
+    """Categorize one field name, memoized across synthesizers"""
+    # str.lower() already takes an ASCII fast path for field names; lowering
+    # an encoded bytes copy instead is slower, since the encode costs more
+    rank = min((_MATCH_RANK[match.group(1)] for match in _TERM_RE.finditer(field.lower())),
+               default=None)
+    return 'Other' if rank is None else _CATEGORY_TERMS[rank][0]
+
+@lru_cache(maxsize=4096)
+def _describe(field: str) -> str:
+    """Describe one field name, memoized across synthesizers"""
+    return _DESCRIPTIONS.get(field, f'Data field: {field}')
+
+class FieldEntry:
+    """What the dictionary records about one normalized field"""
+    # Declared by hand: dataclass(slots=True) would need Python 3.10
+    __slots__ = ('name', 'description', 'entity_types', 'used_by', 'usage_count',
+                 'access_methods', 'variations', 'category', 'sorted_entity_types',
+                 'sorted_access_methods', 'sorted_variations')
+    
+    def __init__(self, name: str = '', description: str = '', category: str = ''):
+        self.name = name
+        self.description = description
+        self.entity_types: Set[str] = set()
+        # Accesses per synthesizer name, and their total kept as a plain int
+        self.used_by: Counter = Counter()
+        self.usage_count = 0
+        self.access_methods: Set[str] = set()
+        self.variations: Set[str] = set()
+        self.category = category
+        # Sorted once the dictionary is built, for every emitter to share
+        self.sorted_entity_types: Tuple[str, ...] = ()
+        self.sorted_access_methods: Tuple[str, ...] = ()
+        self.sorted_variations: Tuple[str, ...] = ()
 
 class DataDictionaryGenerator:
     def __init__(self, analysis_report: Dict):
         self.report = analysis_report
-        self.data_dictionary = defaultdict(lambda: {
-            'description': '',
-            'entity_types': set(),
-            'used_by_synthesizers': [],
-            'access_methods': set(),
-            'variations': set(),
-            'category': ''
-        })
+        self.data_dictionary: Dict[str, FieldEntry] = {}
         
     def build_dictionary(self):
         """Build comprehensive data dictionary from analysis"""
         
+        data_dictionary = self.data_dictionary
+        
         # Process each synthesizer
         for synth in self.report['synthesizer_details']:
             synth_name = synth['name']
@@ -34,76 +115,45 @@ class DataDictionaryGenerator:
                 entity_type = field_access['entity_type']
                 method = field_access['access_method']
                 
-                # Update dictionary entry
-                self.data_dictionary[field]['entity_types'].add(entity_type)
-                self.data_dictionary[field]['used_by_synthesizers'].append(synth_name)
-                self.data_dictionary[field]['access_methods'].add(method)
-                self.data_dictionary[field]['variations'].add(original)
-                
-                # Assign category
-                if not self.data_dictionary[field]['category']:
-                    self.data_dictionary[field]['category'] = self._categorize_field(field)
+                # Assign category and description once, when the field is first seen
+                entry = data_dictionary.get(field)
+                if entry is None:
+                    entry = data_dictionary[field] = FieldEntry(
+                        name=field,
+                        description=self._describe_field(field),
+                        category=self._categorize_field(field)
+                    )
                 
-                # Generate description
-                if not self.data_dictionary[field]['description']:
-                    self.data_dictionary[field]['description'] = self._describe_field(field)
+                # Update dictionary entry
+                entry.entity_types.add(entity_type)
+                entry.used_by[synth_name] += 1
+                entry.usage_count += 1
+                entry.access_methods.add(method)
+                entry.variations.add(original)
+        
+        for entry in data_dictionary.values():
+            entry.sorted_entity_types = tuple(sorted(entry.entity_types))
+            entry.sorted_access_methods = tuple(sorted(entry.access_methods))
+            entry.sorted_variations = tuple(sorted(entry.variations))
     
     def _categorize_field(self, field: str) -> str:
         """Categorize field based on its name and usage"""
-        field_lower = field.lower()
-        
-        if any(term in field_lower for term in ['account', 'shopper', 'id']):
-            return 'Identity & Authentication'
-        elif any(term in field_lower for term in ['billing', 'payment', 'commitment', 'autorenew']):
-            return 'Billing & Payments'
-        elif any(term in field_lower for term in ['entitlement', 'current', 'transitionable']):
-            return 'Entitlements & Permissions'
-        elif any(term in field_lower for term in ['feature', 'widget', 'published']):
-            return 'Features & Configuration'
-        elif any(term in field_lower for term in ['facebook', 'instagram', 'social', 'gem']):
-            return 'Social Media & Marketing'
-        elif any(term in field_lower for term in ['product', 'commerce', 'ols', 'marketplace']):
-            return 'Commerce & Products'
-        elif any(term in field_lower for term in ['appointment', 'ola', 'service', 'calendar']):
-            return 'Appointments & Services'
-        elif any(term in field_lower for term in ['type', 'status']):
-            return 'Status & Types'
-        else:
-            return 'Other'
+        return _categorize(field)
     
     def _describe_field(self, field: str) -> str:
         """Generate human-readable description for field"""
-        descriptions = {
-            'accountId': 'Unique identifier for the account',
-            'id': 'Entity unique identifier',
-            'type': 'Entity type identifier (e.g., wsbvnext, mktgasst)',
-            'entitlementData': 'Complete entitlement information for the account',
-            'entitlements.current': 'Currently active entitlements',
-            'websiteType': 'Type of website (e.g., gocentral)',
-            'features.published': 'Whether the website is published',
-            'features.widgets': 'List of enabled widgets on the website',
-            'billing.commitment': 'Billing commitment type',
-            'account.paymentStatus': 'Current payment status of the account',
-            'social.lastFacebookPost': 'Date of last Facebook post',
-            'social.lastInstagramPost': 'Date of last Instagram post',
-            'commerce.productCount': 'Number of products in the commerce store',
-            'appointments.serviceCount': 'Number of services available for appointments',
-            'appointments.status': 'Status of the appointments system',
-            'customerIntentions': 'Customer intent data for personalization',
-            'features.planType': 'Type of plan the customer is on',
-        }
-        
-        return descriptions.get(field, f'Data field: {field}')
+        return _describe(field)
     
-    def generate_markdown_dictionary(self) -> str:
-        """Generate markdown formatted data dictionary"""
-        output = "# RAD Data Dictionary\n\n"
-        output += "This dictionary documents all data fields used by RAD synthesizers.\n\n"
+    def generate_markdown_dictionary(self, out: TextIO) -> None:
+        """Write markdown formatted data dictionary to out"""
+        write = out.write
+        write("# RAD Data Dictionary\n\n")
+        write("This dictionary documents all data fields used by RAD synthesizers.\n\n")
         
         # Group by category
         categories = defaultdict(list)
-        for field, info in self.data_dictionary.items():
-            categories[info['category']].append((field, info))
+        for info in self.data_dictionary.values():
+            categories[info.category].append(info)
         
         # Sort categories by importance
         category_order = [
@@ -120,43 +170,44 @@ class DataDictionaryGenerator:
         
         for category in category_order:
             if category in categories:
-                output += f"## {category}\n\n"
+                write(f"## {category}\n\n")
                 
                 # Sort fields within category by usage
                 sorted_fields = sorted(
                     categories[category], 
-                    key=lambda x: len(x[1]['used_by_synthesizers']), 
+                    key=attrgetter('usage_count'), 
                     reverse=True
                 )
                 
-                for field, info in sorted_fields:
-                    output += f"### `{field}`\n\n"
-                    output += f"**Description:** {info['description']}\n\n"
-                    output += f"**Used by:** {len(info['used_by_synthesizers'])} synthesizers\n\n"
+                for info in sorted_fields:
+                    use_count = info.usage_count
+                    write(f"### `{info.name}`\n\n")
+                    write(f"**Description:** {info.description}\n\n")
+                    write(f"**Used by:** {use_count} synthesizers\n\n")
                     
-                    if len(info['entity_types']) > 0:
-                        output += f"**Entity Types:** {', '.join(sorted(info['entity_types']))}\n\n"
+                    if len(info.entity_types) > 0:
+                        write(f"**Entity Types:** {', '.join(info.sorted_entity_types)}\n\n")
                     
-                    if len(info['variations']) > 1:
-                        output += "**Access Variations:**\n"
-                        for var in sorted(info['variations']):
-                            output += f"- `{var}`\n"
-                        output += "\n"
+                    if len(info.variations) > 1:
+                        write("**Access Variations:**\n")
+                        for var in info.sorted_variations:
+                            write(f"- `{var}`\n")
+                        write("\n")
                     
-                    if len(info['used_by_synthesizers']) <= 5:
-                        output += "**Used in:**\n"
-                        for synth in sorted(info['used_by_synthesizers']):
-                            output += f"- {synth}\n"
-                        output += "\n"
+                    if use_count <= 5:
+                        # Only the distinct names are sorted, each listed once per access
+                        write("**Used in:**\n")
+                        for synth in sorted(info.used_by):
+                            write(f"- {synth}\n" * info.used_by[synth])
+                        write("\n")
                     
-                    output += "---\n\n"
-        
-        return output
+                    write("---\n\n")
     
-    def generate_synthesizer_requirements(self) -> str:
-        """Generate a view showing what each synthesizer needs"""
-        output = "\n# Synthesizer Data Requirements\n\n"
-        output += "This section shows exactly what data each synthesizer requires.\n\n"
+    def generate_synthesizer_requirements(self, out: TextIO) -> None:
+        """Write a view showing what each synthesizer needs to out"""
+        write = out.write
+        write("\n# Synthesizer Data Requirements\n\n")
+        write("This section shows exactly what data each synthesizer requires.\n\n")
         
         # Group synthesizers by pattern
         patterns = {
@@ -178,36 +229,33 @@ class DataDictionaryGenerator:
         
         for pattern_name, synthesizers in patterns.items():
             if synthesizers:
-                output += f"## {pattern_name}\n\n"
+                write(f"## {pattern_name}\n\n")
                 
                 # Show first 10 synthesizers in detail
                 for synth in synthesizers[:10]:
-                    output += f"### {synth['name']}\n\n"
+                    write(f"### {synth['name']}\n\n")
                     
                     if synth['entity_types']:
-                        output += f"**Entity Types:** {', '.join(synth['entity_types'])}\n\n"
+                        write(f"**Entity Types:** {', '.join(synth['entity_types'])}\n\n")
                     
                     if synth['all_fields']:
-                        output += "**Required Fields:**\n"
-                        # Group fields by entity
-                        fields_by_entity = defaultdict(list)
-                        for field_access in synth['field_accesses']:
-                            entity = field_access['entity_type']
-                            field = field_access['normalized']
-                            fields_by_entity[entity].append(field)
-                        
-                        for entity, fields in sorted(fields_by_entity.items()):
-                            if fields:
-                                output += f"\n*{entity}:*\n"
-                                for field in sorted(set(fields)):
-                                    output += f"- `{field}`\n"
+                        write("**Required Fields:**\n")
+                        for entity, fields in sorted(self._fields_by_entity(synth).items()):
+                            write(f"\n*{entity}:*\n")
+                            for field in sorted(fields):
+                                write(f"- `{field}`\n")
                     
-                    output += "\n---\n\n"
+                    write("\n---\n\n")
                 
                 if len(synthesizers) > 10:
-                    output += f"*... and {len(synthesizers) - 10} more synthesizers with this pattern*\n\n"
-        
-        return output
+                    write(f"*... and {len(synthesizers) - 10} more synthesizers with this pattern*\n\n")
+    
+    def _fields_by_entity(self, synth: Dict) -> Dict[str, Set[str]]:
+        """Group a synthesizer's distinct normalized fields by entity type"""
+        fields_by_entity = defaultdict(set)
+        for field_access in synth['field_accesses']:
+            fields_by_entity[field_access['entity_type']].add(field_access['normalized'])
+        return fields_by_entity
     
     def generate_csv_export(self) -> str:
         """Generate CSV for easy spreadsheet analysis"""
@@ -228,17 +276,19 @@ class DataDictionaryGenerator:
             'Has Variations'
         ])
         
-        # Data rows
-        for field, info in sorted(self.data_dictionary.items()):
-            writer.writerow([
+        # Data rows, handed to the writer in one call
+        writer.writerows(
+            (
                 field,
-                info['category'],
-                info['description'],
-                ', '.join(sorted(info['entity_types'])),
-                len(info['used_by_synthesizers']),
-                ', '.join(sorted(info['access_methods'])),
-                'Yes' if len(info['variations']) > 1 else 'No'
-            ])
+                info.category,
+                info.description,
+                ', '.join(info.sorted_entity_types),
+                info.usage_count,
+                ', '.join(info.sorted_access_methods),
+                'Yes' if len(info.variations) > 1 else 'No'
+            )
+            for field, info in sorted(self.data_dictionary.items())
+        )
         
         return output.getvalue()
 
@@ -250,19 +300,21 @@ def main():
     args = parser.parse_args()
     
     # Load analysis report
-    with open(args.input, 'r') as f:
-        report = json.load(f)
+    if orjson is not None:
+        with open(args.input, 'rb') as f:
+            report = orjson.loads(f.read())
+    else:
+        with open(args.input, 'r') as f:
+            report = json.load(f)
     
     # Generate data dictionary
     generator = DataDictionaryGenerator(report)
     generator.build_dictionary()
     
     # Generate markdown dictionary
-    md_output = generator.generate_markdown_dictionary()
-    md_output += generator.generate_synthesizer_requirements()
-    
-    with open(f"{args.output}.md", 'w') as f:
-        f.write(md_output)
+    with open(f"{args.output}.md", 'w', buffering=1 << 20) as f:
+        generator.generate_markdown_dictionary(f)
+        generator.generate_synthesizer_requirements(f)
     print(f"Data dictionary saved to: {args.output}.md")
     
     # Generate CSV
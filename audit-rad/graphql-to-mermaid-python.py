@@ -1,6 +1,8 @@
 import csv
-import re
+import itertools
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Configuration - adjust these based on your CSV columns
 CONFIG = {
@@ -11,6 +13,9 @@ CONFIG = {
     'rad_id_column': 'radContent.id',  # Column containing RAD IDs
 }
 
+# Mermaid escaping: quotes are escaped and newlines become breaks in one pass
+_MERMAID_ESCAPES = str.maketrans({'"': '\\"', '\n': '<br/>'})
+
 def extract_pure_graphql(query_string):
     """Return the full JavaScript code as-is."""
     if not query_string:
@@ -25,103 +30,113 @@ def format_graphql_for_mermaid(graphql):
         return ''
     
     # Escape special characters for Mermaid
-    formatted = graphql.replace('"', '\\"')
-    formatted = formatted.replace('\n', '<br/>')
-    formatted = re.sub(r'\s+', ' ', formatted)
-    return formatted.strip()
+    formatted = graphql.translate(_MERMAID_ESCAPES)
+    # Splitting on whitespace collapses every run to one space and trims the ends
+    return ' '.join(formatted.split())
+
+def _write_parts(path, parts):
+    """Write one output file from its list of parts."""
+    with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.writelines(parts)
 
-def convert_to_mermaid():
-    """Main function to convert CSV to Mermaid."""
+def convert_to_mermaid(csv_path=None, output_path=None):
+    """Main function to convert CSV to Mermaid, paths default to CONFIG."""
+    csv_path = csv_path or CONFIG['csv_file']
+    output_path = output_path or CONFIG['output_file']
+    # Siblings are named from the stem, so they never collide with output_path
+    stem = os.path.splitext(output_path)[0]
+    alternative_path = f'{stem}-alternative.mmd'
+    simple_path = f'{stem}-simple.md'
     try:
         # Read CSV file
-        with open(CONFIG['csv_file'], 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            rows = list(reader)
+        with open(csv_path, 'r', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            header = next(reader, [])
+            width = len(header)
             
-            # Log available columns
-            if rows:
-                print(f"Available columns: {list(rows[0].keys())}")
-                print(f"Total rows: {len(rows)}")
+            # Resolve the columns to positions once; a repeated name reads its last column
+            positions = {column: i for i, column in enumerate(header)}
+            name_index = positions.get(CONFIG['rad_name_column'])
+            query_index = positions.get(CONFIG['query_column'])
+            id_index = positions.get(CONFIG['rad_id_column'])
             
-            # Start building Mermaid diagram
-            mermaid_content = 'graph TD\n'
+            # Log available columns; rows are streamed, so the total comes after the loop
+            rows = filter(None, reader)  # blank lines are skipped
+            first_row = next(rows, None)
+            if first_row is not None:
+                print(f"Available columns: {list(positions)}")
+                rows = itertools.chain((first_row,), rows)
+            
+            # Build all three formats in one pass over the rows
+            mermaid_parts = ['graph TD\n']
+            alternative_parts = ['```mermaid\ngraph LR\n']
+            simple_parts = ['# RAD Queries\n\n']
             query_count = 0
             
             # Process each row
             for index, row in enumerate(rows):
-                rad_name = row.get(CONFIG['rad_name_column'], f'Query_{index + 1}')
-                query_content = row.get(CONFIG['query_column'])
+                if len(row) < width:
+                    # Cells missing from a short row read as None
+                    row += [None] * (width - len(row))
+                query_content = row[query_index] if query_index is not None else None
                 
-                if query_content:
-                    pure_graphql = extract_pure_graphql(query_content)
-                    
-                    if pure_graphql:
-                        query_count += 1
-                        node_id = f'Q{query_count}'
-                        formatted_query = format_graphql_for_mermaid(pure_graphql)
-                        
-                        # Add node with rad name as title and GraphQL as content
-                        mermaid_content += f'    {node_id}["<b>{rad_name}</b><br/><br/>{formatted_query}"]\n'
-                        
-                        # Add styling
-                        mermaid_content += f'    style {node_id} fill:#f9f9f9,stroke:#333,stroke-width:2px\n'
-            
-            # Create alternative format
-            alternative_content = '```mermaid\ngraph LR\n'
-            query_count_alt = 0
-            
-            for index, row in enumerate(rows):
-                rad_name = row.get(CONFIG['rad_name_column'], f'Query_{index + 1}')
-                query_content = row.get(CONFIG['query_column'])
+                # Rows without a query are the common reject, so test them first
+                if not query_content:
+                    continue
+                pure_graphql = extract_pure_graphql(query_content)
+                if not pure_graphql:
+                    continue
                 
-                if query_content:
-                    pure_graphql = extract_pure_graphql(query_content)
-                    
-                    if pure_graphql:
-                        query_count_alt += 1
-                        alternative_content += f'\n    subgraph {rad_name}\n'
-                        alternative_content += f'        {query_count_alt}["`{pure_graphql}`"]\n'
-                        alternative_content += '    end\n'
-            
-            alternative_content += '```\n'
-            
-            # Create simple format
-            simple_format = '# RAD Queries\n\n'
-            
-            for index, row in enumerate(rows):
-                rad_name = row.get(CONFIG['rad_name_column'], f'Query_{index + 1}')
-                rad_id = row.get(CONFIG['rad_id_column'], '')
-                query_content = row.get(CONFIG['query_column'])
+                rad_name = row[name_index] if name_index is not None else f'Query_{index + 1}'
+                rad_id = row[id_index] if id_index is not None else ''
+                query_count += 1
+                node_id = f'Q{query_count}'
+                formatted_query = format_graphql_for_mermaid(pure_graphql)
+                
+                # Add node with rad name as title and GraphQL as content
+                mermaid_parts.append(f'    {node_id}["<b>{rad_name}</b><br/><br/>{formatted_query}"]\n')
+                
+                # Add styling
+                mermaid_parts.append(f'    style {node_id} fill:#f9f9f9,stroke:#333,stroke-width:2px\n')
+                
+                # Alternative format
+                alternative_parts.append(f'\n    subgraph {rad_name}\n')
+                alternative_parts.append(f'        {query_count}["`{pure_graphql}`"]\n')
+                alternative_parts.append('    end\n')
                 
-                if query_content:
-                    pure_graphql = extract_pure_graphql(query_content)
-                    
-                    if pure_graphql:
-                        # Use RAD ID if available, otherwise just name
-                        title = f'{rad_id}' if rad_id else rad_name
-                        simple_format += f'## {title}\n\n'
-                        simple_format += '```javascript\n'
-                        simple_format += pure_graphql
-                        simple_format += '\n```\n\n'
+                # Simple format, using RAD ID if available, otherwise just name
+                title = f'{rad_id}' if rad_id else rad_name
+                simple_parts.append(f'## {title}\n\n')
+                simple_parts.append('```javascript\n')
+                simple_parts.append(pure_graphql)
+                simple_parts.append('\n```\n\n')
             
-            # Write output files
-            with open(CONFIG['output_file'], 'w', encoding='utf-8') as f:
-                f.write(mermaid_content)
+            if first_row is not None:
+                print(f"Total rows: {index + 1}")
             
-            with open(CONFIG['output_file'].replace('.mmd', '-alternative.mmd'), 'w', encoding='utf-8') as f:
-                f.write(alternative_content)
+            alternative_parts.append('```\n')
             
-            with open(CONFIG['output_file'].replace('.mmd', '-simple.md'), 'w', encoding='utf-8') as f:
-                f.write(simple_format)
+            # Write output files concurrently, the threads overlap on file I/O.
+            # This relies on the three paths being distinct, as derived above.
+            # All writes start together, so when one fails the other files are
+            # still written before the first error in this order is reported.
+            outputs = (
+                (output_path, mermaid_parts),
+                (alternative_path, alternative_parts),
+                (simple_path, simple_parts),
+            )
+            with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+                for future in [executor.submit(_write_parts, path, parts) for path, parts in outputs]:
+                    future.result()
             
             print(f"Successfully processed {query_count} GraphQL queries")
             print("Output files created:")
-            print(f"- {CONFIG['output_file']} (Mermaid diagram)")
-            print(f"- {CONFIG['output_file'].replace('.mmd', '-alternative.mmd')} (Alternative Mermaid format)")
-            print(f"- {CONFIG['output_file'].replace('.mmd', '-simple.md')} (Simple markdown format)")
+            print(f"- {output_path} (Mermaid diagram)")
+            print(f"- {alternative_path} (Alternative Mermaid format)")
+            print(f"- {simple_path} (Simple markdown format)")
             
     except FileNotFoundError:
-        print(f"Error: File not found: {CONFIG['csv_file']}")
+        print(f"Error: File not found: {csv_path}")
     except Exception as e:
         print(f"Error processing CSV: {e}")
 
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Test script for analyze_rad_fields.py
+Tests the field accesses found in synthesizer code
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from analyze_rad_fields import RADFieldAnalyzer
+
+class TestFieldAccessScan(unittest.TestCase):
+    
+    def test_property_access_inside_entity_pick(self):
+        """Test that a property access inside an entityPick array is still reported"""
+        code = "entityPick(entity, ['a', opts.mode === 1 ? 'b' : 'c'])"
+        accesses = list(RADFieldAnalyzer().scan_field_accesses(code))
+        self.assertEqual([access[0] for access in accesses], ['a', 'b', 'c', 'mode'])
+        self.assertEqual(accesses[-1][3], 'direct')
+    
+    def test_query_access_also_read_as_property(self):
+        """Test that a request query access is reported by both direct patterns"""
+        code = "if (myprofile.request.query.x) return [];"
+        accesses = list(RADFieldAnalyzer().scan_field_accesses(code))
+        self.assertEqual([(access[0], access[2]) for access in accesses],
+                         [('request.query.x', 'profile'), ('request.query.x', 'unknown')])
+
+if __name__ == '__main__':
+    # Run tests
+    unittest.main(verbosity=2)
@@ -14,9 +14,14 @@ from pathlib import Path
 import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Import functions directly from the script
-exec(open('graphql-to-mermaid-python.py').read(), globals())
-# Now extract_pure_graphql and format_graphql_for_mermaid are available
+# Load the script as a module; its hyphenated name rules out a plain import
+import importlib.util
+_spec = importlib.util.spec_from_file_location(
+    'g2m', Path(__file__).parent / 'graphql-to-mermaid-python.py')
+g2m = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(g2m)
+extract_pure_graphql = g2m.extract_pure_graphql
+format_graphql_for_mermaid = g2m.format_graphql_for_mermaid
 
 class TestGraphQLExtraction(unittest.TestCase):
     
@@ -189,16 +194,10 @@ class TestGraphQLExtraction(unittest.TestCase):
         
         self.create_test_csv(test_rows)
         
-        # Run the extraction process
-        import subprocess
-        result = subprocess.run([
-            sys.executable, 
-            'graphql-to-mermaid-python.py'
-        ], 
-        cwd=os.path.dirname(self.csv_file),
-        capture_output=True,
-        text=True,
-        env={**os.environ, 'PYTHONPATH': os.path.dirname(os.path.abspath(__file__))}
+        # Run the extraction process in-process
+        g2m.convert_to_mermaid(
+            csv_path=self.csv_file,
+            output_path=os.path.join(self.test_data_dir, 'graphql-queries.mmd')
         )
         
         # Check that output file was created
@@ -261,8 +260,28 @@ profile => {
 """
         
         # Verify the script can handle the test data
-        self.assertEqual(result.returncode, 0, f"Script failed: {result.stderr}")
-    
+        self.assertTrue(os.path.exists(expected_output), "Script did not create the simple output")
+        with open(expected_output, encoding='utf-8') as f:
+            self.assertEqual(f.read(), expected_content)
+
+    def test_output_path_without_mmd_suffix(self):
+        """Test that an output path without .mmd still yields three separate files"""
+        self.create_test_csv([{
+            'radConfig.name': 'EmptyTask',
+            'radContent.id': 'Task-Empty-123',
+            'radContent.synthesize.rule': 'profile => []'
+        }])
+
+        output_path = os.path.join(self.test_data_dir, 'queries.txt')
+        g2m.convert_to_mermaid(csv_path=self.csv_file, output_path=output_path)
+
+        with open(output_path, encoding='utf-8') as f:
+            self.assertTrue(f.read().startswith('graph TD\n'))
+        with open(os.path.join(self.test_data_dir, 'queries-alternative.mmd'), encoding='utf-8') as f:
+            self.assertTrue(f.read().startswith('```mermaid\ngraph LR\n'))
+        with open(os.path.join(self.test_data_dir, 'queries-simple.md'), encoding='utf-8') as f:
+            self.assertEqual(f.read(), "# RAD Queries\n\n## Task-Empty-123\n\n```javascript\nprofile => []\n```\n\n")
+
     def test_mermaid_formatting(self):
         """Test Mermaid diagram formatting"""
         test_query = """profile => {
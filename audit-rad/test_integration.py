@@ -4,25 +4,54 @@ Integration test to verify the graphql-to-mermaid-python.py script
 produces the expected output format
 """
 
+import contextlib
+import importlib.util
+import io
 import os
+import re
 import subprocess
 import sys
+import tempfile
+from pathlib import Path
+
+SCRIPT = Path(__file__).parent / 'graphql-to-mermaid-python.py'
+_HEADING_PATTERN = re.compile(r'^## (.*)$', re.MULTILINE)
+
+def load_script():
+    """Load the script as a module; its hyphenated name rules out a plain import"""
+    spec = importlib.util.spec_from_file_location('g2m', SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def test_cli_entrypoint():
+    """Smoke test the command line entry point without converting the CSV"""
+    
+    # Run where there is no CSV, so the script only has to start and report it
+    with tempfile.TemporaryDirectory() as temp_dir:
+        result = subprocess.run([sys.executable, str(SCRIPT)],
+                                cwd=temp_dir, capture_output=True, text=True)
+    
+    if result.returncode != 0 or 'File not found' not in result.stdout:
+        print(f"❌ Script entry point failed with return code {result.returncode}")
+        print(f"Error: {result.stderr}")
+        return False
+    
+    print("✅ Script entry point runs")
+    return True
 
 def test_script_execution():
     """Test that the script runs successfully and produces expected files"""
     
     print("Running graphql-to-mermaid-python.py...")
     
-    # Run the script
-    result = subprocess.run([
-        sys.executable, 
-        'graphql-to-mermaid-python.py'
-    ], capture_output=True, text=True)
-    
-    # Check return code
-    if result.returncode != 0:
-        print(f"❌ Script failed with return code {result.returncode}")
-        print(f"Error: {result.stderr}")
+    # Run the conversion in-process, its log captured as the subprocess did;
+    # convert_to_mermaid reports its own errors, so success is read from the log
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        load_script().convert_to_mermaid()
+    if 'Successfully processed' not in log.getvalue():
+        print(f"❌ Script failed: {log.getvalue().strip()}")
         return False
     
     print("✅ Script executed successfully")
@@ -34,13 +63,14 @@ def test_script_execution():
         'graphql-queries-simple.md'
     ]
     
+    # One stat per file answers both existence and size
     for file in expected_files:
-        if os.path.exists(file):
-            size = os.path.getsize(file)
-            print(f"✅ {file} exists ({size:,} bytes)")
-        else:
+        try:
+            size = os.stat(file).st_size
+        except OSError:
             print(f"❌ {file} not found")
             return False
+        print(f"✅ {file} exists ({size:,} bytes)")
     
     # Verify content structure
     with open('graphql-queries-simple.md', 'r') as f:
@@ -70,8 +100,10 @@ def test_script_execution():
         'Task-PoyntSetup-sGURMs9~y'
     ]
     
+    # Collect the headings once, then each expected RAD is a set lookup
+    headings = set(_HEADING_PATTERN.findall(content))
     for rad in test_rads:
-        if f'## {rad}' in content:
+        if rad in headings:
             print(f"✅ Found expected RAD: {rad}")
         else:
             print(f"❌ Missing expected RAD: {rad}")
@@ -93,8 +125,8 @@ def main():
     
     print(f"✅ Input CSV file found: {csv_file}")
     
-    # Run the test
-    if test_script_execution():
+    # Run the tests
+    if test_cli_entrypoint() and test_script_execution():
         print("\n🎉 All integration tests passed!")
         return 0
     else:
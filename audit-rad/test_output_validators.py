@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test script for the validators in test_output_validation.py
+Tests the section checks on generated outputs
+"""
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import test_output_validation as tov
+
+def build_output(codes):
+    """Build simple markdown output with one RAD section per code"""
+    sections = [f"## Task-{i}\n\n```javascript\n{code}\n```\n\n" for i, code in enumerate(codes)]
+    return '# RAD Queries\n\n' + ''.join(sections)
+
+class TestOutputValidation(unittest.TestCase):
+    
+    def test_parallel_validation_reports_first_bad_rad(self):
+        """Test that pooled section checks report the first bad RAD"""
+        # One bad RAD in each of the two chunks, so only ordering picks the first
+        codes = ['profile => []'] * 8
+        codes[1] = 'profile => [{ a: 1 }'
+        codes[5] = 'profile => ('
+        content = build_output(codes)
+        
+        # A low threshold takes the pool path; threads stand in for processes
+        with mock.patch.object(tov, '_PARALLEL_MIN_RADS', len(codes)), \
+                mock.patch.object(tov, 'ProcessPoolExecutor', ThreadPoolExecutor), \
+                contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaises(AssertionError) as caught:
+                tov.validate_output_format('<generated>', content, jobs=2)
+        
+        # pytest may append its assert rewriting details to the message
+        message = str(caught.exception)
+        self.assertTrue(message.startswith('Mismatched brackets in Task-1: 1 open vs 0 close'), message)
+        self.assertNotIn('Task-5', message)
+
+if __name__ == '__main__':
+    # Run tests
+    unittest.main(verbosity=2)